@@ -2,7 +2,7 @@ import logging
 from typing import Dict, Any
 from functools import partial
 from langgraph.graph import StateGraph, END
-from langchain_google_genai import ChatGoogleGenerativeAI
+from app.core.llm import get_chat_llm
 from langgraph.checkpoint.memory import InMemorySaver
 from ..base_agent import BaseAgent, AgentState
 from .tools.search_tool.ddg import DuckDuckGoSearchTool
@@ -22,11 +22,7 @@ class DevRelAgent(BaseAgent):
 
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.devrel_agent_model,
-            temperature=0.3,
-            google_api_key=settings.gemini_api_key
-        )
+        self.llm = get_chat_llm(settings.devrel_agent_model, 0.3)
         self.search_tool = DuckDuckGoSearchTool()
         self.faq_tool = FAQTool()
         self.github_toolkit = GitHubToolkit()
@@ -3,7 +3,7 @@ import json
 import re
 import config
 from typing import Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
+from app.core.llm import get_chat_llm
 from langchain_core.messages import HumanMessage
 from app.core.config import settings
 from .prompts.intent_analysis import GITHUB_INTENT_ANALYSIS_PROMPT
@@ -34,11 +34,7 @@ class GitHubToolkit:
     """
 
     def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.github_agent_model,
-            temperature=0.1,
-            google_api_key=settings.gemini_api_key
-        )
+        self.llm = get_chat_llm(settings.github_agent_model, 0.1)
         self.tools = [
             "web_search",
             "contributor_recommendation",
@@ -3,6 +3,7 @@ import logging
 import asyncio
 import config
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from .github_mcp_service import GitHubMCPService
 from typing import Optional
@@ -11,7 +12,7 @@ from typing import Optional
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="GitHub MCP Server", version="1.0.0")
+app = FastAPI(title="GitHub MCP Server", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Load env vars
 GITHUB_ORG = config.GITHUB_ORG
@@ -1,6 +1,8 @@
 import os
-import requests
+import orjson
+import httpx
 import asyncio
+from functools import lru_cache
 from typing import Optional
 import config
 
@@ -10,17 +12,24 @@ class GitHubMCPService:
         if not self.token:
             raise ValueError("GitHub token required; export as GITHUB_TOKEN or place in backend/.env file")
         self.base_url = "https://api.github.com"
+        # One pooled HTTP/2 connection to api.github.com, shared by the worker threads calling this service
+        self.session = httpx.Client(
+            http2=True,
+            headers=self._headers(),
+            timeout=15,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
 
     def repo_query(self, owner: str, repo: str) -> dict:
         url = f"{self.base_url}/repos/{owner}/{repo}"
-        headers = self._headers()
         try:
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = self.session.get(url)
             resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {"error": "Request failed", "message": str(e)}
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         license_info = data.get("license")
         license_name = license_info.get("name") if license_info else "No license specified"
 
@@ -46,14 +55,13 @@ class GitHubMCPService:
         """Fetch issues from a given repository."""
         
         url = f"{self.base_url}/repos/{owner}/{repo}/issues?state={state}&per_page=50"
-        headers = self._headers()
         try:
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = self.session.get(url)
             resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {"error": "Request failed", "message": str(e)}
 
-        issues = resp.json()
+        issues = orjson.loads(resp.content)
         return [
             {
                 "id": i.get("id"),
@@ -71,14 +79,13 @@ class GitHubMCPService:
 
     def list_org_repos(self, org: str) -> list:
         url = f"{self.base_url}/orgs/{org}/repos?per_page=100&type=all"
-        headers = self._headers()
         try:
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = self.session.get(url)
             resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {"error": "Request failed", "message": str(e)}
 
-        repos = resp.json()
+        repos = orjson.loads(resp.content)
         return [
             {
                 "name": r.get("name"),
@@ -103,6 +110,7 @@ class GitHubMCPService:
         }
 
 
+@lru_cache(maxsize=4)
 def _get_service(token: Optional[str] = None) -> GitHubMCPService:
     return GitHubMCPService(token=token or config.GITHUB_TOKEN)
 
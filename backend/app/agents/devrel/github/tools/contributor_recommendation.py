@@ -1,29 +1,49 @@
 import logging
+import orjson
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 from urllib.parse import urlparse
-from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.core.config import settings
+from app.core.llm import ainvoke_cached, get_chat_llm
 from app.database.weaviate.operations import search_contributors
 from app.services.github.issue_processor import GitHubIssueProcessor
 from app.services.embedding_service.service import EmbeddingService
+from app.services.embedding_service.semantic_cache import SemanticCache
 from ..prompts.contributor_recommendation.query_alignment import QUERY_ALIGNMENT_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Filler words the alignment LLM sometimes emits as keywords; they only add BM25 noise
+_KEYWORD_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "of", "for", "with", "in", "on", "to", "or", "using", "based"
+})
+
+
+def _normalize_keywords(keywords: Iterable[Any]) -> List[str]:
+    """Lower-case, strip, drop stopwords and de-duplicate keywords while keeping their order"""
+    normalized = (str(keyword).strip().lower() for keyword in keywords or [])
+    return list(dict.fromkeys(k for k in normalized if k and k not in _KEYWORD_STOPWORDS))
+
+
+def _is_json_object(text: str) -> bool:
+    """True when text parses as a JSON object, the only alignment output worth caching"""
+    try:
+        return isinstance(orjson.loads(text), dict)
+    except orjson.JSONDecodeError:
+        return False
+
+
+# Near-duplicate recommendation queries reuse the last hybrid search instead of hitting Weaviate again
+_search_cache = SemanticCache(maxsize=256, threshold=0.95, ttl_seconds=300)
+
 class ContributorRecommendationWorkflow:
     """
     Contributor recommendation with proper query alignment for hybrid search.
     """
 
     def __init__(self):
-        self.query_alignment_llm = ChatGoogleGenerativeAI(
-            model=settings.github_agent_model,
-            temperature=0.1,
-            google_api_key=settings.gemini_api_key
-        )
+        self.query_alignment_llm = get_chat_llm(settings.github_agent_model, 0.1)
         self.embedding_service = EmbeddingService()
 
     async def _align_user_request(self, query: str) -> Dict[str, Any]:
@@ -42,15 +62,13 @@ class ContributorRecommendationWorkflow:
             full_query = query
 
         prompt = QUERY_ALIGNMENT_PROMPT.format(query=full_query)
-        response = await self.query_alignment_llm.ainvoke([HumanMessage(content=prompt)])
+        response_text = await ainvoke_cached(self.query_alignment_llm, prompt, should_cache=_is_json_object)
 
         try:
-            import json
-            print(response)
-            result = json.loads(response.content.strip())
+            result = orjson.loads(response_text)
             logger.info(f"Query aligned: '{result.get('aligned_query')}' with keywords: {result.get('keywords')}")
             return result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse alignment result, using fallback")
             return {
                 "query_type": "general",
@@ -95,15 +113,23 @@ async def handle_contributor_recommendation(query: str) -> Dict[str, Any]:
         query_embedding = await workflow.embedding_service.get_embedding(enhanced_search_text)
         logger.info(f"Generated embedding with dimension: {len(query_embedding)}")
 
-        logger.info("Performing hybrid search (semantic + keyword matching)")
-
-        results = await search_contributors(
-            query_embedding=query_embedding,
-            keywords=alignment_result.get("keywords", []),
-            limit=5,
-            vector_weight=0.7,  # Semantic similarity
-            bm25_weight=0.3     # Keyword matching
-        )
+        keywords = _normalize_keywords(alignment_result.get("keywords", []))
+        cache_key = tuple(sorted(keywords))
+        results = _search_cache.get(query_embedding, cache_key)
+
+        if results is None:
+            logger.info("Performing hybrid search (semantic + keyword matching)")
+            results = await search_contributors(
+                query_embedding=query_embedding,
+                keywords=keywords,
+                limit=5,
+                vector_weight=0.7,  # Semantic similarity
+                bm25_weight=0.3     # Keyword matching
+            )
+            if results:
+                _search_cache.set(query_embedding, results, cache_key)
+        else:
+            logger.info("Reusing cached hybrid search results for a near-duplicate query")
 
         logger.info(f"Search complete: Found {len(results)} potential contributors")
 
@@ -114,7 +140,7 @@ async def handle_contributor_recommendation(query: str) -> Dict[str, Any]:
                 "recommendations": [],
                 "message": "No suitable contributors found",
                 "search_query": search_text,
-                "keywords_used": alignment_result.get("keywords", []),
+                "keywords_used": keywords,
                 "technical_domain": alignment_result.get("technical_domain", "other")
             }
 
@@ -155,7 +181,7 @@ async def handle_contributor_recommendation(query: str) -> Dict[str, Any]:
             "recommendations": recommendations,
             "message": f"Found {len(recommendations)} suitable contributors",
             "search_query": search_text,
-            "keywords_used": alignment_result.get("keywords", []),
+            "keywords_used": keywords,
             "technical_domain": alignment_result.get("technical_domain", "other"),
             "search_metadata": {
                 "total_candidates": len(results),
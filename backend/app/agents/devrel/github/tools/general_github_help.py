@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
+import hashlib
 import logging
 from langchain_core.messages import HumanMessage
 from app.agents.devrel.nodes.handlers.web_search import _extract_search_query
@@ -8,6 +9,24 @@ from app.agents.devrel.github.prompts.general_github_help import GENERAL_GITHUB_
 logger = logging.getLogger(__name__)
 
 
+def _dedupe_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop search results whose content duplicates an earlier result"""
+    seen = set()
+    unique = []
+    for result in results:
+        content = (result.get("content") or "").strip()
+        # Results without content have nothing to compare, so they are all kept
+        if not content:
+            unique.append(result)
+            continue
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        unique.append(result)
+    return unique
+
+
 async def handle_general_github_help(query: str, llm) -> Dict[str, Any]:
     """Execute general GitHub help with web search and LLM knowledge"""
     logger.info("Providing general GitHub help")
@@ -18,7 +37,7 @@ async def handle_general_github_help(query: str, llm) -> Dict[str, Any]:
 
         if search_result.get("status") == "success":
             search_context = "SEARCH RESULTS:\n"
-            for result in search_result.get("results", []):
+            for result in _dedupe_results(search_result.get("results", [])):
                 search_context += f"- {result.get('title', 'No title')}: {result.get('content', 'No content')}\n"
         else:
             search_context = "No search results available."
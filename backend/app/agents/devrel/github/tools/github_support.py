@@ -8,6 +8,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_ORG = config.GITHUB_ORG
 
+# Substring triggers; "stat" also covers "stats"
+REPO_STAT_WORDS = ("issue", "star", "fork", "stat")
+
 GH_URL_RE = re.compile(
     r'(?:https?://|git@)github\.com[/:]'
     r'([A-Za-z0-9](?:-?[A-Za-z0-9]){0,38})/'
@@ -66,7 +69,7 @@ async def handle_github_supp(query: str, org: Optional[str] = None):
             }
 
         # Issues, stars, forks, stats
-        if any(word in q for word in ["issue", "star", "fork", "stat", "stats"]):
+        if any(word in q for word in REPO_STAT_WORDS):
             if repo_name:
                 if "issue" in q:
                     issues = await github_mcp_service.get_repo_issues(org, repo_name)
@@ -79,7 +82,7 @@ async def handle_github_supp(query: str, org: Optional[str] = None):
                         return {"status": "error", "message": f"Failed to fetch {org}/{repo_name}", "details": repo}
                     return {"status": "success", "message": f"Details for {org}/{repo_name}", "repository": repo}
             else:
-                if any(w in q for w in ["stat", "stats"]):
+                if "stat" in q:
                     stats = await github_mcp_service.get_org_stats(org)
                     return {
                         "status": "success",
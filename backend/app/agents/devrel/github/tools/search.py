@@ -3,14 +3,16 @@ from typing import Dict, Any
 from app.agents.devrel.tools.search_tool.ddg import DuckDuckGoSearchTool
 logger = logging.getLogger(__name__)
 
+# Shared so the search result cache survives across tool calls
+_search_tool = DuckDuckGoSearchTool()
+
 
 async def handle_web_search(query: str) -> Dict[str, Any]:
     """Handle web search using DuckDuckGo search tool"""
     logger.info("Handling web search request")
 
     try:
-        search_tool = DuckDuckGoSearchTool()
-        search_results = await search_tool.search(query, max_results=5)
+        search_results = await _search_tool.search(query, max_results=5)
 
         if not search_results:
             return {
@@ -1,10 +1,10 @@
 import logging
 import json
-from typing import Dict, Any
+from typing import Dict, Any, AsyncGenerator, List
 from datetime import datetime
 from app.agents.state import AgentState
-from langchain_core.messages import HumanMessage
-from ..prompts.response_prompt import RESPONSE_PROMPT
+from langchain_core.messages import HumanMessage, SystemMessage
+from ..prompts.response_prompt import RESPONSE_PROMPT, RESPONSE_SYSTEM_PROMPT
 from app.database.supabase.services import store_interaction
 
 logger = logging.getLogger(__name__)
@@ -34,12 +34,8 @@ async def generate_response_node(state: AgentState, llm) -> Dict[str, Any]:
             "current_task": "response_error"
         }
 
-async def _create_response(state: AgentState, llm) -> str:
-    """
-    Response Generation and LLM synthesis
-    """
-    logger.info(f"Creating response for session {state.session_id}")
-
+def _build_response_messages(state: AgentState) -> List[Any]:
+    """Assemble the system prefix and per-request prompt for response generation"""
     latest_message = _get_latest_message(state)
 
     conversation_summary = state.conversation_summary or "This is the beginning of our conversation."
@@ -94,11 +90,49 @@ async def _create_response(state: AgentState, llm) -> str:
 
     except KeyError as e:
         logger.error(f"Missing key in RESPONSE_PROMPT: {e}")
+        raise
+
+    return [
+        SystemMessage(content=RESPONSE_SYSTEM_PROMPT),
+        HumanMessage(content=prompt)
+    ]
+
+async def _create_response(state: AgentState, llm) -> str:
+    """
+    Response Generation and LLM synthesis
+    """
+    logger.info(f"Creating response for session {state.session_id}")
+
+    try:
+        messages = _build_response_messages(state)
+    except KeyError as e:
         return f"Error: Response template formatting error - {str(e)}"
 
-    response = await llm.ainvoke([HumanMessage(content=prompt)])
+    response = await llm.ainvoke(messages)
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    cache_read = usage.get("input_token_details", {}).get("cache_read", 0)
+    logger.debug(f"Response prompt tokens: {usage.get('input_tokens', 0)} (cache read: {cache_read})")
+
     return response.content.strip()
 
+async def stream_response(state: AgentState, llm) -> AsyncGenerator[str, None]:
+    """
+    Stream the final response token chunks as they are generated so callers
+    can start delivering text before the full answer is complete.
+    """
+    logger.info(f"Streaming response for session {state.session_id}")
+
+    try:
+        messages = _build_response_messages(state)
+    except KeyError as e:
+        yield f"Error: Response template formatting error - {str(e)}"
+        return
+
+    async for chunk in llm.astream(messages):
+        if chunk.content:
+            yield chunk.content
+
 def _get_latest_message(state: AgentState) -> str:
     """Extract the latest message from state"""
     if state.messages:
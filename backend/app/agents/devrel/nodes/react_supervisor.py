@@ -7,6 +7,8 @@ from ..prompts.react_prompt import REACT_SUPERVISOR_PROMPT
 
 logger = logging.getLogger(__name__)
 
+VALID_ACTIONS = frozenset({"web_search", "faq_handler", "onboarding", "github_toolkit", "complete"})
+
 async def react_supervisor_node(state: AgentState, llm) -> Dict[str, Any]:
     """ReAct Supervisor: Think -> Act -> Observe"""
     logger.info(f"ReAct Supervisor thinking for session {state.session_id}")
@@ -88,7 +90,7 @@ def _parse_supervisor_decision(response: str) -> Dict[str, Any]:
                 decision["thinking"] = line.replace("THINK:", "").strip()
             elif line.startswith("ACT:"):
                 action = line.replace("ACT:", "").strip().lower()
-                if action in ["web_search", "faq_handler", "onboarding", "github_toolkit", "complete"]:
+                if action in VALID_ACTIONS:
                     decision["action"] = action
             elif line.startswith("REASON:"):
                 decision["reasoning"] = line.replace("REASON:", "").strip()
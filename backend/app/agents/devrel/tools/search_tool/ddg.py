@@ -1,6 +1,8 @@
 import asyncio
 import logging
-from typing import List, Dict, Any
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from ddgs import DDGS
 from langsmith import traceable
 
@@ -9,8 +11,27 @@ logger = logging.getLogger(__name__)
 class DuckDuckGoSearchTool:
     """DDGS-based DuckDuckGo search integration"""
 
-    def __init__(self):
-        pass
+    def __init__(self, cache_size: int = 256, cache_ttl: float = 600.0):
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
+    def _cache_get(self, key: Tuple[str, int]) -> Optional[List[Dict[str, Any]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+
+    def _cache_set(self, key: Tuple[str, int], results: List[Dict[str, Any]]) -> None:
+        self._cache[key] = (time.monotonic(), results)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     def _perform_search(self, query: str, max_results: int):
         with DDGS() as ddg:
@@ -18,6 +39,12 @@ class DuckDuckGoSearchTool:
         
     @traceable(name="duckduckgo_search_tool", run_type="tool")
     async def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        cache_key = (" ".join(query.lower().split()), max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("DuckDuckGo search cache hit for: %s", query)
+            return cached
+
         try:
             response = await asyncio.to_thread(
                 self._perform_search, 
@@ -33,6 +60,8 @@ class DuckDuckGoSearchTool:
                     "url": result.get("href", ""),
                     "score": 0
                 })
+            if results:
+                self._cache_set(cache_key, results)
             return results
         
         except (ConnectionError, TimeoutError) as e:
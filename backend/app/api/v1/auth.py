@@ -16,6 +16,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Strong references so fire-and-forget tasks are not garbage collected mid-flight
+_background_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Run a coroutine in the background without blocking the response"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _notify_verified(bot, discord_id: str) -> None:
+    """DM the user the final hand-off message once their GitHub account is linked"""
+    try:
+        discord_user = await bot.fetch_user(int(discord_id))
+        await send_final_handoff_dm(discord_user)
+    except Exception as e:
+        logger.warning(f"Could not DM verification success: {e}")
+
 @router.get("/callback", response_class=HTMLResponse)
 async def auth_callback(
     request: Request,
@@ -84,19 +104,15 @@ async def auth_callback(
 
         logger.info(f"Indexing user: {verified_user.id} into Weaviate...")
         try:
-            asyncio.create_task(profile_user_from_github(str(verified_user.id), github_username))
+            _spawn(profile_user_from_github(str(verified_user.id), github_username))
             logger.info(f"User profiling started in background for: {verified_user.id}")
         except Exception as e:
             logger.error(f"Error starting user profiling: {verified_user.id}: {str(e)}")
 
-        # Optional: DM the user that they're all set with final hand-off message
-        try:
-            bot = app_instance.discord_bot if app_instance else None
-            if bot and getattr(verified_user, "discord_id", None):
-                discord_user = await bot.fetch_user(int(verified_user.discord_id))
-                await send_final_handoff_dm(discord_user)
-        except Exception as e:
-            logger.warning(f"Could not DM verification success: {e}")
+        # Optional: DM the user that they're all set, concurrently with rendering the response
+        bot = app_instance.discord_bot if app_instance else None
+        if bot and getattr(verified_user, "discord_id", None):
+            _spawn(_notify_verified(bot, verified_user.discord_id))
 
         return _success_response(github_username)
 
@@ -1,25 +1,64 @@
+import hashlib
 import logging
-from typing import Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
+import time
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+from app.core.llm import get_chat_llm
 from langchain_core.messages import HumanMessage
 from app.core.config import settings
 from .prompt import DEVREL_TRIAGE_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Messages shorter than this with no question mark are chatter ("ok", "thanks!") not worth an LLM call
+MIN_TRIAGE_LENGTH = 10
+
 class ClassificationRouter:
     """Simple DevRel triage - determines if message needs DevRel assistance"""
 
-    def __init__(self, llm_client=None):
-        self.llm = llm_client or ChatGoogleGenerativeAI(
-            model=settings.classification_agent_model,
-            temperature=0.1,
-            google_api_key=settings.gemini_api_key
-        )
+    def __init__(self, llm_client=None, cache_size: int = 4096, cache_ttl: float = 600.0):
+        self.llm = llm_client or get_chat_llm(settings.classification_agent_model, 0.1)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._verdicts: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def is_trivial_message(message: str) -> bool:
+        """Cheap pre-filter for messages that never need triage"""
+        text = message.strip()
+        return len(text) < MIN_TRIAGE_LENGTH and "?" not in text
+
+    @staticmethod
+    def _verdict_key(message: str) -> bytes:
+        return hashlib.blake2b(" ".join(message.lower().split()).encode("utf-8"), digest_size=16).digest()
+
+    def _cached_verdict(self, key: bytes):
+        entry = self._verdicts.get(key)
+        if entry is None:
+            return None
+        stored_at, verdict = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._verdicts[key]
+            return None
+        self._verdicts.move_to_end(key)
+        return verdict
+
+    def _store_verdict(self, key: bytes, verdict: Dict[str, Any]) -> None:
+        self._verdicts[key] = (time.monotonic(), verdict)
+        self._verdicts.move_to_end(key)
+        if len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
 
     async def should_process_message(self, message: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Simple triage: Does this message need DevRel assistance?"""
         try:
+            # Identical messages (FAQs, repeated pings) get the same verdict without another LLM call
+            key = self._verdict_key(message)
+            cached = self._cached_verdict(key)
+            if cached is not None:
+                return {**cached, "original_message": message}
+
             triage_prompt = DEVREL_TRIAGE_PROMPT.format(
                 message=message,
                 context=context or 'No additional context'
@@ -33,15 +72,15 @@ class ClassificationRouter:
                 json_end = response_text.rfind('}') + 1
                 json_str = response_text[json_start:json_end]
 
-                import json
-                result = json.loads(json_str)
+                result = orjson.loads(json_str)
 
-                return {
+                verdict = {
                     "needs_devrel": result.get("needs_devrel", True),
                     "priority": result.get("priority", "medium"),
                     "reasoning": result.get("reasoning", "LLM classification"),
-                    "original_message": message
                 }
+                self._store_verdict(key, verdict)
+                return {**verdict, "original_message": message}
 
             return self._fallback_triage(message)
 
@@ -14,7 +14,11 @@ class Settings(BaseSettings):
 
     # Platforms
     github_token: str = ""
+    # Optional extra tokens, comma-separated, to spread GitHub API rate limits across
+    github_tokens: str = ""
     discord_bot_token: str = ""
+    # Run the Discord gateway inside the API process; disable for API-only deployments
+    enable_discord_bot: bool = True
 
     # DB configuration
     supabase_url: str
@@ -39,6 +43,9 @@ class Settings(BaseSettings):
     # Backend URL
     backend_url: str = ""
 
+    # "development" enables uvicorn's auto-reload; anything else runs without the file watcher
+    environment: str = "development"
+
     # Onboarding UX toggles
     onboarding_show_oauth_button: bool = True
 
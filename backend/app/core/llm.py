@@ -0,0 +1,56 @@
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import HumanMessage
+from langchain_google_genai import ChatGoogleGenerativeAI
+from app.core.config import settings
+
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 3600.0
+
+_response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+
+@lru_cache(maxsize=8)
+def get_chat_llm(model: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """Return a shared Gemini chat client for the given model and temperature"""
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=settings.gemini_api_key
+    )
+
+
+async def ainvoke_cached(
+    llm: BaseChatModel,
+    prompt: str,
+    should_cache: Optional[Callable[[str], bool]] = None
+) -> str:
+    """
+    Invoke the LLM with a single prompt, reusing the response for an identical (model, prompt) pair.
+    Only non-empty responses that pass should_cache (when given) are stored, so a malformed
+    answer is retried on the next call instead of being replayed for the whole TTL.
+    """
+    key = hashlib.blake2b(
+        f"{getattr(llm, 'model', '')}\0{getattr(llm, 'temperature', '')}\0{prompt}".encode("utf-8"),
+        digest_size=16
+    ).digest()
+
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= RESPONSE_CACHE_TTL:
+        _response_cache.move_to_end(key)
+        return entry[1]
+
+    response = await llm.ainvoke([HumanMessage(content=prompt)])
+    content = response.content.strip()
+    if not content or (should_cache is not None and not should_cache(content)):
+        return content
+
+    _response_cache[key] = (time.monotonic(), content)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+    return content
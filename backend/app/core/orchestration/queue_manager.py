@@ -1,10 +1,11 @@
 import asyncio
+import itertools
 import logging
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 import aio_pika
-import json
+import orjson
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,16 @@ class QueuePriority(str, Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+# Lower ranks are handled first among messages already delivered to this process
+PRIORITY_RANK = {
+    QueuePriority.HIGH: 0,
+    QueuePriority.MEDIUM: 1,
+    QueuePriority.LOW: 2,
+}
+
+# A delivered, unacked message as (priority rank, arrival order, message)
+_ReadyItem = Tuple[int, int, aio_pika.abc.AbstractIncomingMessage]
+
 class AsyncQueueManager:
     """Queue manager for agent orchestration"""
 
@@ -26,6 +37,9 @@ class AsyncQueueManager:
         self.handlers: Dict[str, Callable] = {}
         self.running = False
         self.worker_tasks = []
+        self.consumers: List[Tuple[aio_pika.abc.AbstractQueue, str]] = []
+        self._ready: "asyncio.PriorityQueue[_ReadyItem]" = asyncio.PriorityQueue()
+        self._arrival = itertools.count()
         self.connection: Optional[aio_pika.RobustConnection] = None
         self.channel: Optional[aio_pika.abc.AbstractChannel] = None
 
@@ -45,10 +59,20 @@ class AsyncQueueManager:
             raise
 
     async def start(self, num_workers: int = 3):
-        """Start the queue processing workers"""
+        """Start consuming from every priority queue and the workers that process deliveries"""
         await self.connect()
         self.running = True
 
+        # RabbitMQ pushes messages to us instead of workers polling each queue every 100ms.
+        # Prefetch is per consumer, so up to num_workers messages per queue wait in _ready,
+        # where workers always take the highest priority first
+        await self.channel.set_qos(prefetch_count=num_workers)
+
+        for priority in (QueuePriority.HIGH, QueuePriority.MEDIUM, QueuePriority.LOW):
+            queue = await self.channel.declare_queue(self.queues[priority], durable=True)
+            consumer_tag = await queue.consume(self._make_consumer(priority))
+            self.consumers.append((queue, consumer_tag))
+
         for i in range(num_workers):
             task = asyncio.create_task(self._worker(f"worker-{i}"))
             self.worker_tasks.append(task)
@@ -59,11 +83,21 @@ class AsyncQueueManager:
         """Stop the queue processing"""
         self.running = False
 
+        for queue, consumer_tag in self.consumers:
+            try:
+                await queue.cancel(consumer_tag)
+            except Exception as e:
+                logger.warning(f"Error cancelling consumer {consumer_tag}: {e}")
+        self.consumers.clear()
+
         # Cancel all worker tasks
         for task in self.worker_tasks:
             task.cancel()
 
         await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks.clear()
+        # Anything still in _ready is unacked and goes back to RabbitMQ when the channel closes
+        self._ready = asyncio.PriorityQueue()
         if self.channel:
             await self.channel.close()
         if self.connection:
@@ -84,7 +118,7 @@ class AsyncQueueManager:
             "priority": priority,
             "data": message
         }
-        json_message = json.dumps(queue_item).encode()
+        json_message = orjson.dumps(queue_item)
         await self.channel.default_exchange.publish(
             aio_pika.Message(body=json_message),
             routing_key=self.queues[priority]
@@ -96,32 +130,30 @@ class AsyncQueueManager:
         self.handlers[message_type] = handler
         logger.info(f"Registered handler for message type: {message_type}")
 
+    def _make_consumer(self, priority: QueuePriority) -> Callable:
+        """Build the push callback for one priority queue"""
+        rank = PRIORITY_RANK[priority]
+
+        async def on_message(message: aio_pika.abc.AbstractIncomingMessage):
+            self._ready.put_nowait((rank, next(self._arrival), message))
+
+        return on_message
+
     async def _worker(self, worker_name: str):
-        """Worker coroutine to process queue items"""
+        """Worker coroutine to process delivered messages, highest priority first"""
         logger.info(f"Started queue worker: {worker_name}")
-        # Each worker listens to all queues by priority
-        queues = [
-            await self.channel.declare_queue(self.queues[priority], durable=True)
-            for priority in [QueuePriority.HIGH, QueuePriority.MEDIUM, QueuePriority.LOW]
-        ]
-        while self.running:
-            for queue in queues:
-                try:
-                    message = await queue.get(no_ack=False, fail=False)
-                    if message:
-                        try:
-                            item = json.loads(message.body.decode())
-                            await self._process_item(item, worker_name)
-                            await message.ack()
-                        except Exception as e:
-                            logger.error(f"Error processing message: {e}")
-                            await message.nack(requeue=False)
-                except asyncio.CancelledError:
-                    logger.info(f"Worker {worker_name} cancelled")
-                    return
-                except Exception as e:
-                    logger.error(f"Worker {worker_name} error: {e}")
-            await asyncio.sleep(0.1)
+        while True:
+            _, _, message = await self._ready.get()
+            try:
+                item = orjson.loads(message.body)
+                await self._process_item(item, worker_name)
+                await message.ack()
+            except asyncio.CancelledError:
+                logger.info(f"Worker {worker_name} cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                await message.nack(requeue=False)
 
     async def _process_item(self, item: Dict[str, Any], worker_name: str):
         """Process a queue item"""
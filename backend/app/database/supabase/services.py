@@ -33,19 +33,16 @@ async def ensure_user_exists(
         platform_id_column = f"{platform}_id"
         platform_username_column = f"{platform}_username"
 
-        # Check if user exists
-        response = await supabase.table("users").select("id").eq(platform_id_column, user_id).limit(1).execute()
+        last_active_column = f"last_active_{platform}"
+
+        # Touch last_active and look the user up in one round-trip; an empty result means a new user
+        response = await supabase.table("users").update({
+            last_active_column: datetime.now().isoformat()
+        }).eq(platform_id_column, user_id).execute()
 
         if response.data:
             user_uuid = response.data[0]['id']
             logger.info(f"User found: {user_uuid} for {platform_id_column}: {user_id}")
-
-            # Update last_active timestamp
-            last_active_column = f"last_active_{platform}"
-            await supabase.table("users").update({
-                last_active_column: datetime.now().isoformat()
-            }).eq("id", user_uuid).execute()
-
             return user_uuid
 
         # User doesn't exist, create new user
@@ -63,7 +60,6 @@ async def ensure_user_exists(
             new_user["avatar_url"] = avatar_url
 
         # Set last_active timestamp
-        last_active_column = f"last_active_{platform}"
         new_user[last_active_column] = datetime.now().isoformat()
 
         insert_response = await supabase.table("users").insert(new_user).execute()
@@ -1,3 +1,4 @@
+import asyncio
 import weaviate
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -6,6 +7,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 _client = None
+_connect_lock = asyncio.Lock()
 
 
 def get_client():
@@ -17,16 +19,29 @@ def get_client():
 
 @asynccontextmanager
 async def get_weaviate_client() -> AsyncGenerator[weaviate.WeaviateClient, None]:
-    """Async context manager for Weaviate client."""
+    """Async context manager yielding the shared, already-connected Weaviate client."""
     client = get_client()
     try:
-        await client.connect()
+        # Connect once and keep the HTTP/gRPC channels open; closing here would also
+        # tear the connection down under any other coroutine still using the client
+        if not client.is_connected():
+            async with _connect_lock:
+                if not client.is_connected():
+                    await client.connect()
         yield client
     except Exception as e:
         logger.error(f"Weaviate client error: {str(e)}")
         raise
+
+
+async def close_weaviate_client():
+    """Close the shared Weaviate client on application shutdown."""
+    global _client
+    if _client is None:
+        return
+    try:
+        await _client.close()
+    except Exception as e:
+        logger.warning(f"Error closing Weaviate client: {str(e)}")
     finally:
-        try:
-            await client.close()
-        except Exception as e:
-            logger.warning(f"Error closing Weaviate client: {str(e)}")
+        _client = None
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-import json
+import orjson
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 from app.models.database.weaviate import WeaviateUserProfile
@@ -225,13 +226,14 @@ class WeaviateUserOperations:
         Hybrid search combining vector similarity and BM25 keyword search.
         """
         try:
-            vector_results = await self.search_similar_contributors(
-                query_embedding, limit
-            ) if query_embedding else []
+            async def no_results() -> List[Dict[str, Any]]:
+                return []
 
-            bm25_results = await self.search_contributors_by_keywords(
-                keywords, limit
-            ) if keywords else []
+            # The two searches are independent, so run them concurrently
+            vector_results, bm25_results = await asyncio.gather(
+                self.search_similar_contributors(query_embedding, limit) if query_embedding else no_results(),
+                self.search_contributors_by_keywords(keywords, limit) if keywords else no_results()
+            )
 
             combined = {}
 
@@ -288,8 +290,8 @@ class WeaviateUserOperations:
                 if response.objects:
                     properties = response.objects[0].properties
 
-                    repositories = json.loads(properties.get("repositories", "[]"))
-                    pull_requests = json.loads(properties.get("pull_requests", "[]"))
+                    repositories = orjson.loads(properties.get("repositories") or "[]")
+                    pull_requests = orjson.loads(properties.get("pull_requests") or "[]")
 
                     return WeaviateUserProfile(
                         user_id=properties.get("user_id"),
@@ -324,8 +326,9 @@ class WeaviateUserOperations:
         """
         profile_dict = profile.model_dump()
 
-        profile_dict["repositories"] = json.dumps([repo.model_dump() for repo in profile.repositories])
-        profile_dict["pull_requests"] = json.dumps([pr.model_dump() for pr in profile.pull_requests])
+        # Reuse the dumped nested models instead of dumping each repo/PR a second time
+        profile_dict["repositories"] = orjson.dumps(profile_dict["repositories"]).decode()
+        profile_dict["pull_requests"] = orjson.dumps(profile_dict["pull_requests"]).decode()
 
         if isinstance(profile.last_updated, datetime):
             if profile.last_updated.tzinfo is None:
@@ -6,7 +6,16 @@ async def create_schema(client, name, properties):
     await client.collections.create(
         name=name,
         properties=properties,
-        vectorizer_config=wc.Configure.Vectorizer.none()
+        vectorizer_config=wc.Configure.Vectorizer.none(),
+        # Explicit HNSW graph so near_vector queries are sub-linear ANN lookups
+        vector_index_config=wc.Configure.VectorIndex.hnsw(
+            distance_metric=wc.VectorDistances.COSINE,
+            max_connections=32,
+            ef_construction=128,
+            ef=64,
+            # 8-bit scalar quantization: 4x smaller in-memory vectors, candidates rescored on full precision
+            quantizer=wc.Configure.VectorIndex.Quantizer.sq(rescore_limit=64)
+        )
     )
     print(f"Created: {name}")
 
@@ -16,8 +25,11 @@ async def create_user_profile_schema(client):
     Main vectorization will be on profile_text_for_embedding field.
     """
     properties = [
-        wc.Property(name="user_id", data_type=wc.DataType.TEXT),
-        wc.Property(name="github_username", data_type=wc.DataType.TEXT),
+        # Identifier fields are exact-match filter keys: keep them out of the BM25 index
+        wc.Property(name="user_id", data_type=wc.DataType.TEXT,
+                    tokenization=wc.Tokenization.FIELD, index_searchable=False),
+        wc.Property(name="github_username", data_type=wc.DataType.TEXT,
+                    tokenization=wc.Tokenization.FIELD, index_searchable=False),
         wc.Property(name="display_name", data_type=wc.DataType.TEXT),
         wc.Property(name="bio", data_type=wc.DataType.TEXT),
         wc.Property(name="location", data_type=wc.DataType.TEXT),
@@ -1,7 +1,8 @@
 import json
 import asyncio
 from datetime import datetime
-from app.database.weaviate.client import get_weaviate_client
+from app.database.weaviate.client import get_weaviate_client, close_weaviate_client
+from app.services.embedding_service.service import EmbeddingService
 
 async def populate_weaviate_user_profile(client):
     """
@@ -273,11 +274,17 @@ async def populate_weaviate_user_profile(client):
     ]
 
     try:
+        # One batched forward pass for every sample profile, so they are reachable by near_vector
+        vectors = await EmbeddingService().get_embeddings(
+            [profile["profile_text_for_embedding"] for profile in user_profiles]
+        )
+
         collection = client.collections.get("weaviate_user_profile")
         async with collection.batch.dynamic() as batch:
-            for profile in user_profiles:
+            for profile, vector in zip(user_profiles, vectors):
                 batch.add_object(
-                    properties=profile
+                    properties=profile,
+                    vector=vector
                 )
         print("✅ Populated weaviate_user_profile with sample user data.")
     except Exception as e:
@@ -296,6 +303,8 @@ async def populate_all_collections():
     except Exception as e:
         print(f"❌ Error during population: {e}")
         raise
+    finally:
+        await close_weaviate_client()
 
 def main():
     """Entry point for running the population script."""
@@ -1,13 +1,31 @@
 import logging
 import aiohttp
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from app.database.supabase.client import get_supabase_client
 import os
 
 logger = logging.getLogger(__name__)
 
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Shared keep-alive session to code-graph-backend; per-request timeouts are passed on each call"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60))
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared session on shutdown"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
 
 class RepoService:
     """Service for repository code graph operations using code-graph-backend"""
@@ -96,54 +114,55 @@ class RepoService:
             logger.info(f"Calling code-graph-backend: {self.backend_url}/analyze_repo")
 
             # Call code-graph-backend to index repository
-            async with aiohttp.ClientSession(timeout=self.indexing_timeout) as session:
-                async with session.post(
-                    f"{self.backend_url}/analyze_repo",
-                    json={
-                        "repo_url": github_url,
-                        "ignore": [
-                            "./.git", "./.github", "./node_modules", "./venv",
-                            "./.venv", "./build", "./dist", "./__pycache__",
-                            "./target", "./.pytest_cache", "./.mypy_cache",
-                            "./.tox", "./coverage", "./.coverage", "./htmlcov"
-                        ]
-                    },
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": self.secret_token
-                    }
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json() if await response.text() else {}
-
-                        await self.supabase.table("indexed_repositories").update({
-                            "indexing_status": "completed",
-                            "indexed_at": datetime.now().isoformat(),
-                            "node_count": data.get("node_count", 0),
-                            "edge_count": data.get("edge_count", 0),
-                            "last_error": None
-                        }).eq("repository_full_name", repo_info['full_name']).eq(
-                            "is_deleted", False
-                        ).execute()
+            session = await get_http_session()
+            async with session.post(
+                f"{self.backend_url}/analyze_repo",
+                timeout=self.indexing_timeout,
+                json={
+                    "repo_url": github_url,
+                    "ignore": [
+                        "./.git", "./.github", "./node_modules", "./venv",
+                        "./.venv", "./build", "./dist", "./__pycache__",
+                        "./target", "./.pytest_cache", "./.mypy_cache",
+                        "./.tox", "./coverage", "./.coverage", "./htmlcov"
+                    ]
+                },
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": self.secret_token
+                }
+            ) as response:
+                if response.status == 200:
+                    data = await response.json() if await response.text() else {}
+
+                    await self.supabase.table("indexed_repositories").update({
+                        "indexing_status": "completed",
+                        "indexed_at": datetime.now().isoformat(),
+                        "node_count": data.get("node_count", 0),
+                        "edge_count": data.get("edge_count", 0),
+                        "last_error": None
+                    }).eq("repository_full_name", repo_info['full_name']).eq(
+                        "is_deleted", False
+                    ).execute()
 
-                        return {
-                            "status": "success",
-                            "repo": repo_info['full_name'],
-                            "graph_name": graph_name,
-                            "nodes": data.get("node_count", 0),
-                            "edges": data.get("edge_count", 0)
-                        }
-                    else:
-                        error_msg = (await response.text())[:500]
+                    return {
+                        "status": "success",
+                        "repo": repo_info['full_name'],
+                        "graph_name": graph_name,
+                        "nodes": data.get("node_count", 0),
+                        "edges": data.get("edge_count", 0)
+                    }
+                else:
+                    error_msg = (await response.text())[:500]
 
-                        await self.supabase.table("indexed_repositories").update({
-                            "indexing_status": "failed",
-                            "last_error": error_msg
-                        }).eq("repository_full_name", repo_info['full_name']).eq(
-                            "is_deleted", False
-                        ).execute()
+                    await self.supabase.table("indexed_repositories").update({
+                        "indexing_status": "failed",
+                        "last_error": error_msg
+                    }).eq("repository_full_name", repo_info['full_name']).eq(
+                        "is_deleted", False
+                    ).execute()
 
-                        return {"status": "error", "message": f"Indexing failed: {error_msg}"}
+                    return {"status": "error", "message": f"Indexing failed: {error_msg}"}
 
         except ValueError as e:
             return {"status": "error", "message": str(e)}
@@ -194,41 +213,42 @@ class RepoService:
             graph_name = repo_data['graph_name']
             logger.info(f"Querying graph: {graph_name}")
 
-            async with aiohttp.ClientSession(timeout=self.query_timeout) as session:
-                async with session.post(
-                    f"{self.backend_url}/chat",
-                    json={
-                        "repo": repo_data['graph_name'],
-                        "msg": question
-                    },
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": self.secret_token
-                    }
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        answer = data.get("response")
-
-                        if not answer:
-                            return {
-                                "status": "error",
-                                "message": "No response received. Try rephrasing your question."
-                            }
+            session = await get_http_session()
+            async with session.post(
+                f"{self.backend_url}/chat",
+                timeout=self.query_timeout,
+                json={
+                    "repo": repo_data['graph_name'],
+                    "msg": question
+                },
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": self.secret_token
+                }
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    answer = data.get("response")
 
-                        return {
-                            "status": "success",
-                            "answer": answer,
-                            "cypher": data.get("cypher_query", "")
-                        }
-                    else:
-                        error_text = (await response.text())[:200]
-                        logger.error(f"Query failed [{response.status}]: {error_text}")
+                    if not answer:
                         return {
                             "status": "error",
-                            "message": "Query failed. Please try again or rephrase your question."
+                            "message": "No response received. Try rephrasing your question."
                         }
 
+                    return {
+                        "status": "success",
+                        "answer": answer,
+                        "cypher": data.get("cypher_query", "")
+                    }
+                else:
+                    error_text = (await response.text())[:200]
+                    logger.error(f"Query failed [{response.status}]: {error_text}")
+                    return {
+                        "status": "error",
+                        "message": "Query failed. Please try again or rephrase your question."
+                    }
+
         except aiohttp.ClientError as e:
             logger.exception(f"Network error querying {repo_full_name}: {e}")
             return {"status": "error", "message": "Network error. Please try again."}
@@ -250,22 +270,23 @@ class RepoService:
 
             graph_name = result.data[0]["graph_name"]
 
-            async with aiohttp.ClientSession(timeout=self.query_timeout) as session:
-                async with session.post(
-                    f"{self.backend_url}/delete_graph",
-                    json={"graph_name": graph_name},
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": self.secret_token
+            session = await get_http_session()
+            async with session.post(
+                f"{self.backend_url}/delete_graph",
+                timeout=self.query_timeout,
+                json={"graph_name": graph_name},
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": self.secret_token
+                }
+            ) as response:
+                if response.status != 200:
+                    error_text = (await response.text())[:200]
+                    logger.error(f"Backend delete failed [{response.status}]: {error_text}")
+                    return {
+                        "status": "error",
+                        "message": "Failed to delete graph from backend. Please contact support."
                     }
-                ) as response:
-                    if response.status != 200:
-                        error_text = (await response.text())[:200]
-                        logger.error(f"Backend delete failed [{response.status}]: {error_text}")
-                        return {
-                            "status": "error",
-                            "message": "Failed to delete graph from backend. Please contact support."
-                        }
 
             await self.supabase.table("indexed_repositories").update({
                 "is_deleted": True,
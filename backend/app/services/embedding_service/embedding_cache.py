@@ -0,0 +1,113 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent SQLite store of (model, sha256(text)) -> float32 embedding bytes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"Embedding cache opened at {path}")
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SQLite connection; the cache is unusable afterwards"""
+        with self._lock:
+            self._conn.close()
+        logger.info(f"Embedding cache closed at {self.path}")
+
+    @staticmethod
+    def _key(model_name: str, text: str) -> bytes:
+        return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).digest()
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for text, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (self._key(model_name, text),)
+            ).fetchone()
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+
+    def set(self, model_name: str, text: str, vector: np.ndarray) -> None:
+        """Store the embedding for text"""
+        blob = np.asarray(vector, dtype=np.float32).tobytes()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                (self._key(model_name, text), blob)
+            )
+            self._conn.commit()
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return cached embeddings for whichever of texts are present, keyed by text"""
+        keys = {self._key(model_name, text): text for text in texts}
+        found: Dict[str, np.ndarray] = {}
+        key_list = list(keys)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+            for key, blob in rows:
+                found[keys[key]] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def set_many(self, model_name: str, texts: List[str], vectors: np.ndarray) -> None:
+        """Store one embedding per text in a single transaction"""
+        rows = [
+            (self._key(model_name, text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+
+_caches: Dict[str, Optional[EmbeddingCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(path: str) -> Optional[EmbeddingCache]:
+    """Open one shared cache per path; an empty path or an unusable file disables caching"""
+    if not path:
+        return None
+    with _caches_lock:
+        if path not in _caches:
+            try:
+                _caches[path] = EmbeddingCache(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache disabled, could not open {path}: {str(e)}")
+                _caches[path] = None
+        return _caches[path]
+
+
+def close_embedding_caches() -> None:
+    """Close every cache opened through get_embedding_cache"""
+    with _caches_lock:
+        caches = [cache for cache in _caches.values() if cache is not None]
+        _caches.clear()
+    for cache in caches:
+        cache.close()
@@ -0,0 +1,75 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    LRU cache keyed by a random-projection LSH bucket of a query embedding.
+    Near-duplicate queries land in the same bucket and reuse the cached value
+    when their cosine similarity to the stored embedding clears the threshold.
+    """
+
+    def __init__(
+        self,
+        num_planes: int = 16,
+        maxsize: int = 1024,
+        threshold: float = 0.95,
+        ttl_seconds: float = 300.0,
+        seed: int = 0
+    ):
+        self.num_planes = num_planes
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._rng = np.random.default_rng(seed)
+        self._planes: Optional[np.ndarray] = None
+        self._entries: "OrderedDict[Tuple[Hashable, int], Tuple[np.ndarray, Any, float]]" = OrderedDict()
+
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _bucket(self, vector: np.ndarray) -> int:
+        if self._planes is None or self._planes.shape[1] != vector.shape[0]:
+            self._planes = self._rng.standard_normal((self.num_planes, vector.shape[0])).astype(np.float32)
+            self._entries.clear()
+        bits = np.packbits(self._planes @ vector > 0)
+        return int.from_bytes(bits.tobytes(), "big")
+
+    def get(self, embedding: Sequence[float], extra_key: Hashable = None) -> Optional[Any]:
+        """Return the cached value for a near-duplicate query, or None on a miss"""
+        vector = self._normalize(embedding)
+        key = (extra_key, self._bucket(vector))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        cached_vector, value, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        if float(np.dot(vector, cached_vector)) < self.threshold:
+            return None
+
+        self._entries.move_to_end(key)
+        logger.debug(f"Semantic cache hit for bucket {key[1]}")
+        return value
+
+    def set(self, embedding: Sequence[float], value: Any, extra_key: Hashable = None) -> None:
+        """Store a value for the query embedding, evicting the least recently used entry when full"""
+        vector = self._normalize(embedding)
+        key = (extra_key, self._bucket(vector))
+        self._entries[key] = (vector, value, time.monotonic())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
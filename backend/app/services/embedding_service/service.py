@@ -1,23 +1,143 @@
+import asyncio
 import logging
 import config
-from typing import List, Dict, Any, Optional
-import torch
+from functools import lru_cache
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set, Tuple
+import numpy as np
 from pydantic import BaseModel
-from sentence_transformers import SentenceTransformer
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
 from app.core.config import settings
+from app.core.llm import get_chat_llm
 from app.models.database.weaviate import WeaviateUserProfile
+from app.services.embedding_service.embedding_cache import EmbeddingCache, get_embedding_cache
 from app.services.embedding_service.profile_summarization.prompts.summarization_prompt import PROFILE_SUMMARIZATION_PROMPT
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 
 MODEL_NAME = config.MODEL_NAME
 MAX_BATCH_SIZE = config.MAX_BATCH_SIZE
 EMBEDDING_DEVICE = config.EMBEDDING_DEVICE
+EMBEDDING_BACKEND = config.EMBEDDING_BACKEND
+EMBEDDING_ONNX_FILE = config.EMBEDDING_ONNX_FILE
+EMBEDDING_CACHE_PATH = config.EMBEDDING_CACHE_PATH
 
 
 logger = logging.getLogger(__name__)
 
+RECENT_EMBEDDINGS_SIZE = 2048
+
+# In-process first layer in front of the on-disk cache: (model key, text) -> embedding
+_recent_embeddings: "OrderedDict[Tuple[str, str], Tuple[float, ...]]" = OrderedDict()
+
+
+@lru_cache(maxsize=4)
+def _load_sentence_transformer(model_name: str, device: str, backend: str = "torch") -> "SentenceTransformer":
+    """Load a SentenceTransformer once per (model, device, backend) and share it across service instances"""
+    # Imported here so importing this module doesn't pull in torch/transformers before the first embedding
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Loading embedding model: {model_name} ({backend} backend)")
+    if backend == "onnx":
+        # Dynamically int8-quantized ONNX graph: smaller and faster on CPU than fp32 PyTorch
+        try:
+            model = SentenceTransformer(
+                model_name,
+                device=device,
+                backend="onnx",
+                model_kwargs={"file_name": EMBEDDING_ONNX_FILE}
+            )
+        except Exception as e:
+            logger.warning(f"Could not load ONNX model {EMBEDDING_ONNX_FILE}, falling back to torch: {str(e)}")
+            model = SentenceTransformer(model_name, device=device)
+    else:
+        model = SentenceTransformer(model_name, device=device)
+    logger.info(f"Model loaded successfully. Embedding dimension: {model.get_sentence_embedding_dimension()}")
+    return model
+
+
+class _EncodeBatcher:
+    """Coalesces concurrent single-text encodes for one loaded model into batched forward passes"""
+
+    def __init__(self, model: "SentenceTransformer", max_batch: int = MAX_BATCH_SIZE):
+        self.model = model
+        self.max_batch = max_batch
+        self._pending: "OrderedDict[str, List[asyncio.Future]]" = OrderedDict()
+        self._scheduled: Optional[asyncio.Handle] = None
+        self._in_flight = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Strong references so running batches aren't garbage-collected mid-encode
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def encode(self, text: str) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Nothing queued on a previous (now finished) loop can still complete
+            self._loop, self._pending, self._scheduled, self._in_flight = loop, OrderedDict(), None, 0
+        future = loop.create_future()
+        self._pending.setdefault(text, []).append(future)
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif not self._in_flight and self._scheduled is None:
+            # Idle model: encode on the next loop turn, picking up only callers from this same turn.
+            # While a batch is running, new texts wait for it to finish and go out together
+            self._scheduled = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        batch, self._pending = self._pending, OrderedDict()
+        if not batch:
+            return
+        self._in_flight += 1
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Embedding batch failed: {str(task.exception())}")
+
+    async def _run(self, batch: "OrderedDict[str, List[asyncio.Future]]") -> None:
+        texts = list(batch)
+        try:
+            embeddings = await asyncio.to_thread(
+                self.model.encode,
+                texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=MAX_BATCH_SIZE,
+                show_progress_bar=False
+            )
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        finally:
+            self._in_flight -= 1
+            # Texts that queued up behind this batch go out together as the next one
+            if self._pending and not self._in_flight:
+                self._flush()
+
+        if len(texts) > 1:
+            logger.debug(f"Encoded {len(texts)} queued texts in one batch")
+        for text, embedding in zip(texts, np.asarray(embeddings, dtype=np.float32)):
+            for future in batch[text]:
+                if not future.done():
+                    future.set_result(embedding)
+
+
+# One batcher per loaded model, keyed like _load_sentence_transformer: (model, device, backend)
+_batchers: Dict[Tuple[str, str, str], _EncodeBatcher] = {}
+
 
 class ProfileSummaryResult(BaseModel):
     """Result of profile summarization"""
@@ -28,38 +148,40 @@ class ProfileSummaryResult(BaseModel):
 class EmbeddingService:
     """Service for generating embeddings and profile summarization for Weaviate integration"""
 
-    def __init__(self, model_name: str = MODEL_NAME, device: str = EMBEDDING_DEVICE):
+    def __init__(self, model_name: str = MODEL_NAME, device: str = EMBEDDING_DEVICE, backend: str = EMBEDDING_BACKEND):
         """Initialize the embedding service with specified model and LLM"""
         self.model_name = model_name
         self.device = device
+        self.backend = backend
         self._model = None
         self._llm = None
+        self._cache = None
         logger.info(f"Initializing EmbeddingService with model: {model_name} on device: {device}")
 
     @property
-    def model(self) -> SentenceTransformer:
+    def model(self) -> "SentenceTransformer":
         """Lazy-load embedding model to avoid loading during import"""
         if self._model is None:
             try:
-                logger.info(f"Loading embedding model: {self.model_name}")
-                self._model = SentenceTransformer(self.model_name, device=self.device)
-                logger.info(
-                    f"Model loaded successfully. Embedding dimension: {self._model.get_sentence_embedding_dimension()}")
+                self._model = _load_sentence_transformer(self.model_name, self.device, self.backend)
             except Exception as e:
                 logger.error(f"Error loading model {self.model_name}: {str(e)}")
                 raise
         return self._model
 
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """Persistent embedding cache shared across instances and restarts"""
+        if self._cache is None:
+            self._cache = get_embedding_cache(EMBEDDING_CACHE_PATH)
+        return self._cache
+
     @property
     def llm(self) -> ChatGoogleGenerativeAI:
         """Lazy-load LLM for profile summarization"""
         if self._llm is None:
             try:
-                self._llm = ChatGoogleGenerativeAI(
-                    model=settings.github_agent_model,
-                    temperature=0.3,
-                    google_api_key=settings.gemini_api_key
-                )
+                self._llm = get_chat_llm(settings.github_agent_model, 0.3)
                 logger.info("LLM initialized for profile summarization")
             except Exception as e:
                 logger.error(f"Error initializing LLM: {str(e)}")
@@ -67,46 +189,131 @@ class EmbeddingService:
         return self._llm
 
     async def get_embedding(self, text: str) -> List[float]:
-        """Generate embedding for a single text input"""
+        """Generate a unit-length embedding for a single text input"""
         try:
-            # Convert to list for consistency
-            if isinstance(text, str):
-                text = [text]
-
-            # Generate embeddings
-            embeddings = self.model.encode(
-                text,
-                convert_to_tensor=True,
-                show_progress_bar=False
-            )
-
-            # Convert to standard Python list and return
-            embedding_list = embeddings[0].cpu().tolist()
+            if isinstance(text, list):
+                text = text[0]
+
+            recent_key = (self.cache_key, text)
+            recent = _recent_embeddings.get(recent_key)
+            if recent is not None:
+                _recent_embeddings.move_to_end(recent_key)
+                return list(recent)
+
+            cached = await self._cache_get(text)
+            if cached is not None:
+                embedding_list = cached.tolist()
+                self._remember(recent_key, embedding_list)
+                return embedding_list
+
+            # Concurrent misses share one forward pass, run in a worker thread off the event loop
+            batcher_key = (self.model_name, self.device, self.backend)
+            batcher = _batchers.get(batcher_key)
+            if batcher is None:
+                batcher = _batchers[batcher_key] = _EncodeBatcher(self.model)
+            vector = await batcher.encode(text)
+
+            # One C-level float32 -> list conversion; the cache stores the raw buffer
+            await self._cache_set(text, vector)
+            embedding_list = vector.tolist()
+            self._remember(recent_key, embedding_list)
             logger.debug(f"Generated embedding with dimension: {len(embedding_list)}")
             return embedding_list
         except Exception as e:
             logger.error(f"Error generating embedding: {str(e)}")
             raise
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple text inputs in batches"""
+    @property
+    def cache_key(self) -> str:
+        return f"{self.model_name}:{self.backend}"
+
+    @staticmethod
+    def _remember(key: Tuple[str, str], embedding: List[float]) -> None:
+        _recent_embeddings[key] = tuple(embedding)
+        _recent_embeddings.move_to_end(key)
+        if len(_recent_embeddings) > RECENT_EMBEDDINGS_SIZE:
+            _recent_embeddings.popitem(last=False)
+
+    async def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        # SQLite reads and commits block on disk, so every cache call runs in a worker thread like model.encode
         try:
-            # Generate embeddings
-            embeddings = self.model.encode(
-                texts,
-                convert_to_tensor=True,
-                batch_size=MAX_BATCH_SIZE,
-                show_progress_bar=len(texts) > 10
-            )
+            return await asyncio.to_thread(self.cache.get, self.cache_key, text) if self.cache else None
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed: {str(e)}")
+            return None
 
-            # Convert to standard Python list
-            embedding_list = embeddings.cpu().tolist()
-            logger.info(f"Generated {len(embedding_list)} embeddings")
-            return embedding_list
+    async def _cache_set(self, text: str, vector: np.ndarray) -> None:
+        try:
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, self.cache_key, text, vector)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {str(e)}")
+
+    async def _cache_get_many(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        try:
+            return await asyncio.to_thread(self.cache.get_many, self.cache_key, texts) if self.cache else {}
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed: {str(e)}")
+            return {}
+
+    async def _cache_set_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        try:
+            if self.cache:
+                await asyncio.to_thread(self.cache.set_many, self.cache_key, texts, vectors)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {str(e)}")
+
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate unit-length embeddings for multiple text inputs in batches"""
+        embedding_list = (await self.get_embeddings_array(texts)).tolist()
+        logger.info(f"Generated {len(embedding_list)} embeddings")
+        return embedding_list
+
+    async def get_embeddings_array(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+        """Generate a (len(texts), dim) float32 matrix, L2-normalized by default so dot products are cosines"""
+        try:
+            # Identical texts are embedded once and scattered back to every position
+            unique_index: Dict[str, int] = {}
+            positions = [unique_index.setdefault(text, len(unique_index)) for text in texts]
+            unique_texts = list(unique_index)
+
+            # Only normalized vectors are cached, matching what get_embedding stores
+            cached = await self._cache_get_many(unique_texts) if normalize else {}
+            missing = [text for text in unique_texts if text not in cached]
+
+            fresh = {}
+            if missing:
+                model = self.model
+                encoded = await asyncio.to_thread(
+                    model.encode,
+                    missing,
+                    convert_to_numpy=True,
+                    normalize_embeddings=normalize,
+                    batch_size=MAX_BATCH_SIZE,
+                    show_progress_bar=len(missing) > 10
+                )
+                encoded = np.asarray(encoded, dtype=np.float32)
+                if normalize:
+                    await self._cache_set_many(missing, encoded)
+                fresh = dict(zip(missing, encoded))
+
+            if cached:
+                logger.debug(f"Embedding cache served {len(cached)} of {len(unique_texts)} texts")
+            embeddings = np.stack([cached[text] if text in cached else fresh[text] for text in unique_texts]) \
+                if unique_texts else np.empty((0, 0), dtype=np.float32)
+            if len(unique_texts) == len(texts):
+                return embeddings
+            logger.debug(f"Embedded {len(unique_texts)} unique texts out of {len(texts)}")
+            return embeddings[positions]
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {str(e)}")
             raise
 
+    async def similarity_matrix(self, texts: List[str]) -> np.ndarray:
+        """Pairwise cosine similarity of texts computed with a single matrix product"""
+        embeddings = await self.get_embeddings_array(texts)
+        return embeddings @ embeddings.T
+
     async def summarize_user_profile(self, profile: WeaviateUserProfile) -> ProfileSummaryResult:
         """Generate a comprehensive summary of a user profile optimized for embedding and semantic search."""
         try:
@@ -206,6 +413,7 @@ class EmbeddingService:
         return {
             "model_name": self.model_name,
             "device": self.device,
+            "backend": self.backend,
             "embedding_size": self.model.get_sentence_embedding_dimension(),
         }
 
@@ -214,12 +422,16 @@ class EmbeddingService:
         if self._model:
             del self._model
             self._model = None
+        _load_sentence_transformer.cache_clear()
+        _batchers.clear()
+        _recent_embeddings.clear()
         if self._llm:
             del self._llm
             self._llm = None
         # Force garbage collection
         import gc
         gc.collect()
-        if torch.cuda.is_available():
+        if self.device.startswith("cuda"):
+            import torch
             torch.cuda.empty_cache()
         logger.info("Cleared embedding service cache")
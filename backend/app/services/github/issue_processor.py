@@ -1,9 +1,9 @@
+import asyncio
 import logging
 from typing import List
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage
 
 from app.core.config import settings
+from app.core.llm import ainvoke_cached, get_chat_llm
 from app.services.embedding_service.service import EmbeddingService
 from app.services.github.user.profiling import GitHubUserProfiler
 from app.agents.devrel.github.prompts.contributor_recommendation.issue_summarization import ISSUE_SUMMARIZATION_PROMPT
@@ -20,11 +20,7 @@ class GitHubIssueProcessor:
         self.owner = owner
         self.repo = repo
         self.issue_number = issue_number
-        self.summarizer_llm = ChatGoogleGenerativeAI(
-            model=settings.github_agent_model,
-            temperature=0.1,
-            google_api_key=settings.gemini_api_key
-        )
+        self.summarizer_llm = get_chat_llm(settings.github_agent_model, 0.1)
         self.embedding_service = EmbeddingService()
 
     async def fetch_issue_content(self) -> str:
@@ -36,7 +32,11 @@ class GitHubIssueProcessor:
             issue_url = f"{profiler.base_url}/repos/{self.owner}/{self.repo}/issues/{self.issue_number}"
             comments_url = f"{issue_url}/comments"
 
-            issue_data = await profiler.request(issue_url)
+            # The issue and its comments are independent requests; fetch them together
+            issue_data, comments_data = await asyncio.gather(
+                profiler.request(issue_url),
+                profiler.request(comments_url)
+            )
             if not issue_data:
                 raise ValueError("Failed to fetch issue data.")
 
@@ -45,7 +45,6 @@ class GitHubIssueProcessor:
                 f"Body: {issue_data['body']}",
             ]
 
-            comments_data = await profiler.request(comments_url)
             if comments_data:
                 comment_texts = [
                     f"Comment by {c['user']['login']}: {c['body']}"
@@ -59,9 +58,9 @@ class GitHubIssueProcessor:
         """Generates a technical summary of the issue content using an LLM."""
         logger.info(f"Summarizing issue content for {self.owner}/{self.repo}#{self.issue_number}")
         prompt = ISSUE_SUMMARIZATION_PROMPT.format(issue_content=content)
-        response = await self.summarizer_llm.ainvoke([HumanMessage(content=prompt)])
-        logger.info(f"Generated summary: {response.content.strip()[:100]}")
-        return response.content.strip()
+        summary = await ainvoke_cached(self.summarizer_llm, prompt)
+        logger.info(f"Generated summary: {summary[:100]}")
+        return summary
 
     async def get_embedding_for_issue(self) -> List[float]:
         """
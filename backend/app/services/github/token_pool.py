@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Hourly REST quota GitHub grants an authenticated token
+GITHUB_RATE_LIMIT = 5000
+
+
+class GitHubTokenPool:
+    """
+    Spreads GitHub REST calls across one or more tokens using the
+    X-RateLimit-Remaining / X-RateLimit-Reset headers of each response.
+    """
+
+    def __init__(self, tokens: List[str], min_remaining: int = 50):
+        if not tokens:
+            raise ValueError("At least one GitHub token is required")
+        self.tokens = list(dict.fromkeys(tokens))
+        self.min_remaining = min_remaining
+        self._remaining: Dict[str, int] = {token: GITHUB_RATE_LIMIT for token in self.tokens}
+        self._reset_at: Dict[str, float] = {token: 0.0 for token in self.tokens}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """
+        Return the token with the most remaining quota while one is at or above min_remaining,
+        otherwise the token whose quota resets soonest
+        """
+        now = time.time()
+        with self._lock:
+            for token in self.tokens:
+                if self._reset_at[token] and self._reset_at[token] <= now:
+                    self._remaining[token] = GITHUB_RATE_LIMIT
+                    self._reset_at[token] = 0.0
+            best = max(self.tokens, key=lambda token: self._remaining[token])
+            if self._remaining[best] >= self.min_remaining:
+                return best
+            return min(self.tokens, key=lambda token: (self._reset_at[token], -self._remaining[token]))
+
+    def update(self, token: str, headers: Mapping[str, str]) -> None:
+        """Record the quota GitHub reported for token"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None:
+            return
+        with self._lock:
+            self._remaining[token] = int(remaining)
+            if reset is not None:
+                self._reset_at[token] = float(reset)
+        if int(remaining) < self.min_remaining:
+            logger.warning(f"GitHub token ...{token[-4:]} has {remaining} requests left until {reset}")
+
+    def mark_exhausted(self, token: str, reset: Optional[str] = None) -> None:
+        """Park a token that hit its limit until GitHub's reset time"""
+        with self._lock:
+            self._remaining[token] = 0
+            self._reset_at[token] = float(reset) if reset else time.time() + 60
+
+    def seconds_until_available(self) -> float:
+        """Seconds until some token has quota again, 0 if one already does"""
+        with self._lock:
+            if any(remaining > 0 for remaining in self._remaining.values()):
+                return 0.0
+            return max(0.0, min(self._reset_at.values()) - time.time())
+
+
+@lru_cache(maxsize=1)
+def get_token_pool() -> GitHubTokenPool:
+    """Shared pool built from GITHUB_TOKEN plus any comma-separated GITHUB_TOKENS"""
+    extra = [token.strip() for token in settings.github_tokens.split(",") if token.strip()]
+    tokens = [settings.github_token] if settings.github_token else []
+    return GitHubTokenPool(tokens + extra)
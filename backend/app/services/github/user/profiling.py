@@ -1,6 +1,7 @@
 import logging
 import asyncio
 import aiohttp
+import orjson
 from typing import List, Optional, Dict
 from datetime import datetime
 from collections import Counter
@@ -8,6 +9,7 @@ from app.models.database.weaviate import WeaviateUserProfile, WeaviateRepository
 from app.database.weaviate.operations import store_user_profile
 from app.services.embedding_service.service import EmbeddingService
 from app.core.config import settings
+from app.services.github.token_pool import get_token_pool
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +21,12 @@ class GitHubUserProfiler:
     """
 
     def __init__(self):
-        if not settings.github_token:
+        if not settings.github_token and not settings.github_tokens:
             raise ValueError("GitHub token not configured in environment variables")
 
+        # Authorization is chosen per request from the shared token pool
+        self.token_pool = get_token_pool()
         self.headers = {
-            "Authorization": f"token {settings.github_token}",
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "DevRel-AI-Bot/1.0"
         }
@@ -55,18 +58,29 @@ class GitHubUserProfiler:
     async def _make_request(self, url: str, params: Dict = None) -> Optional[Dict]:
         """Make a GET request to GitHub API"""
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    logger.warning(f"GitHub API 404: {url}")
-                    return None
-                elif response.status == 403:
-                    logger.error(f"GitHub API rate limit exceeded: {url}")
-                    return None
-                else:
-                    logger.error(f"GitHub API error {response.status}: {url}")
-                    return None
+            # One retry lets a rate-limited token hand over to another in the pool
+            for attempt in range(2):
+                token = self.token_pool.acquire()
+                headers = {"Authorization": f"token {token}"}
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    self.token_pool.update(token, response.headers)
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    elif response.status == 404:
+                        logger.warning(f"GitHub API 404: {url}")
+                        return None
+                    elif response.status in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+                        self.token_pool.mark_exhausted(token, response.headers.get("X-RateLimit-Reset"))
+                        if attempt == 0 and self.token_pool.seconds_until_available() == 0:
+                            continue
+                        logger.error(f"GitHub API rate limit exceeded: {url}")
+                        return None
+                    elif response.status == 403:
+                        logger.error(f"GitHub API request forbidden: {url}")
+                        return None
+                    else:
+                        logger.error(f"GitHub API error {response.status}: {url}")
+                        return None
         except asyncio.TimeoutError:
             logger.error(f"Timeout accessing GitHub API: {url}")
             return None
@@ -255,15 +269,10 @@ class GitHubUserProfiler:
             except Exception as e:
                 logger.warning(f"Error processing repositories: {str(e)}")
 
-        all_languages = set()
+        # Languages are tallied once, in analyze_language_frequency
         all_topics = set()
-        total_stars = 0
-        total_forks = 0
-
-        for repo_obj in repositories:
-            all_languages.update(repo_obj.languages)
-            total_stars += repo_obj.stars
-            total_forks += repo_obj.forks
+        total_stars = sum(repo_obj.stars for repo_obj in repositories)
+        total_forks = sum(repo_obj.forks for repo_obj in repositories)
 
         for repo_data in repos_data:
             topics = repo_data.get("topics", [])
@@ -325,9 +334,8 @@ async def profile_user_from_github(user_id: str, github_username: str) -> bool:
             except Exception as e:
                 logger.error(f"Error processing profile with embedding service for {github_username}: {str(e)}")
                 return False
-            finally:
-                embedding_service.clear_cache()
 
         except Exception as e:
             logger.error(f"Failed to profile user {github_username}: {str(e)}")
             return False
+
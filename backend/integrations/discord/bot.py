@@ -1,12 +1,51 @@
 import discord
 from discord.ext import commands
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from app.core.orchestration.queue_manager import AsyncQueueManager, QueuePriority
 from app.classification.classification_router import ClassificationRouter
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on remembered user -> thread mappings; least recently used users are forgotten first
+MAX_ACTIVE_THREADS = 10_000
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+PRIORITY_MAP = {
+    "high": QueuePriority.HIGH,
+    "medium": QueuePriority.MEDIUM,
+    "low": QueuePriority.LOW,
+}
+DEFAULT_PRIORITY = QueuePriority.MEDIUM
+
+
+def split_message(text: str, limit: int = DISCORD_MESSAGE_LIMIT):
+    """
+    Yield non-blank chunks of at most limit characters, breaking at the last newline,
+    then whitespace, when possible
+    """
+    # Only the separator a chunk is cut on is dropped, so indented code keeps its shape across messages
+    remaining = text.strip()
+    while len(remaining) > limit:
+        # The character at index limit may be the separator itself, since it isn't kept
+        cut = remaining.rfind("\n", 0, limit + 1)
+        if cut < 0:
+            cut = max(remaining.rfind(" ", 0, limit + 1), remaining.rfind("\t", 0, limit + 1))
+            # Leading whitespace is indentation, not a break point
+            if cut < len(remaining) - len(remaining.lstrip(" \t")):
+                cut = -1
+        if cut < 0:
+            chunk, remaining = remaining[:limit], remaining[limit:]
+        else:
+            chunk, remaining = remaining[:cut], remaining[cut + 1:]
+        # Discord rejects blank messages, so a run of separators never goes out on its own
+        if chunk.strip():
+            yield chunk.rstrip()
+    if remaining.strip():
+        yield remaining.rstrip()
+
 class DiscordBot(commands.Bot):
     """Discord bot with LangGraph agent integration"""
 
@@ -26,7 +65,7 @@ class DiscordBot(commands.Bot):
 
         self.queue_manager = queue_manager
         self.classifier = ClassificationRouter()
-        self.active_threads: Dict[str, str] = {}
+        self.active_threads: "OrderedDict[str, str]" = OrderedDict()
         self._register_queue_handlers()
 
     def _register_queue_handlers(self):
@@ -36,12 +75,11 @@ class DiscordBot(commands.Bot):
     async def on_ready(self):
         """Bot ready event"""
         logger.info(f'Enhanced Discord bot logged in as {self.user}')
-        print(f'Bot is ready! Logged in as {self.user}')
         try:
             synced = await self.tree.sync()
-            print(f"Synced {len(synced)} slash command(s)")
+            logger.info(f"Synced {len(synced)} slash command(s)")
         except Exception as e:
-            print(f"Failed to sync slash commands: {e}")
+            logger.error(f"Failed to sync slash commands: {e}")
 
     async def on_message(self, message):
         """Handles regular chat messages, but ignores slash commands."""
@@ -51,6 +89,16 @@ class DiscordBot(commands.Bot):
         if message.interaction_metadata is not None:
             return
 
+        # Other bots and attachment-only messages never need triage
+        if message.author.bot or not message.content.strip():
+            return
+
+        # Skip short chatter unless it's addressed to the bot or continues the user's DevRel thread
+        if self.classifier.is_trivial_message(message.content):
+            in_active_thread = self.active_threads.get(str(message.author.id)) == str(message.channel.id)
+            if not in_active_thread and self.user not in message.mentions:
+                return
+
         try:
             triage_result = await self.classifier.should_process_message(
                 message.content,
@@ -91,11 +139,7 @@ class DiscordBot(commands.Bot):
                     "avatar_url": str(message.author.avatar.url) if message.author.avatar else None
                 }
             }
-            priority_map = {"high": QueuePriority.HIGH,
-                            "medium": QueuePriority.MEDIUM,
-                            "low": QueuePriority.LOW
-                            }
-            priority = priority_map.get(triage_result.get("priority"), QueuePriority.MEDIUM)
+            priority = PRIORITY_MAP.get(triage_result.get("priority"), DEFAULT_PRIORITY)
             await self.queue_manager.enqueue(agent_message, priority)
 
             # --- "PROCESSING" MESSAGE RESTORED ---
@@ -114,6 +158,7 @@ class DiscordBot(commands.Bot):
                 thread_id = self.active_threads[user_id]
                 thread = self.get_channel(int(thread_id))
                 if thread and not thread.archived:
+                    self.active_threads.move_to_end(user_id)
                     return thread_id
                 else:
                     del self.active_threads[user_id]
@@ -123,6 +168,8 @@ class DiscordBot(commands.Bot):
                 thread_name = f"DevRel Chat - {message.author.display_name}"
                 thread = await message.create_thread(name=thread_name, auto_archive_duration=60)
                 self.active_threads[user_id] = str(thread.id)
+                if len(self.active_threads) > MAX_ACTIVE_THREADS:
+                    self.active_threads.popitem(last=False)
                 await thread.send(f"Hello {message.author.mention}! I've created this thread to help you. How can I assist?")
                 return str(thread.id)
         except Exception as e:
@@ -137,8 +184,9 @@ class DiscordBot(commands.Bot):
                 return
             thread = self.get_channel(int(thread_id))
             if thread:
-                for i in range(0, len(response_text), 2000):
-                    await thread.send(response_text[i:i+2000])
+                # Sent in order; discord.py already paces sends against the channel rate limit
+                for chunk in split_message(response_text):
+                    await thread.send(chunk)
             else:
                 logger.error(f"Thread {thread_id} not found for agent response")
         except Exception as e:
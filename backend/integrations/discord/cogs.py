@@ -38,9 +38,9 @@ class DevRelCommands(commands.Cog):
     async def cleanup_expired_tokens(self):
         """Periodic cleanup of expired verification tokens"""
         try:
-            print("--> Running token cleanup task...")
+            logger.debug("Running token cleanup task")
             await cleanup_expired_tokens()
-            print("--> Token cleanup task finished.")
+            logger.debug("Token cleanup task finished")
         except Exception as e:
             logger.error(f"Error during token cleanup: {e}")
 
@@ -423,7 +423,7 @@ class OnboardingCog(commands.Cog):
             description="\n\n".join(description_blocks).strip(),
             color=discord.Color.blue(),
         )
-        embed.set_author(name=member.display_name if hasattr(member, "display_name") else str(member))
+        embed.set_author(name=getattr(member, "display_name", str(member)))
         embed.set_footer(text="Link expires after a short time for security.")
         return embed
 
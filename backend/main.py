@@ -1,17 +1,24 @@
 import asyncio
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.router import api_router
 from app.core.config import settings
 from app.core.orchestration.agent_coordinator import AgentCoordinator
 from app.core.orchestration.queue_manager import AsyncQueueManager
-from app.database.weaviate.client import get_weaviate_client
+from app.database.weaviate.client import get_weaviate_client, close_weaviate_client
+from app.services.codegraph.repo_service import close_http_session
+from app.services.embedding_service.embedding_cache import close_embedding_caches
 from integrations.discord.bot import DiscordBot
 from discord.ext import commands
 # DevRel commands are now loaded dynamically (commented out below)
@@ -21,6 +28,15 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# Hand records to a background thread so handler I/O never blocks the event loop
+_root_logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,16 +61,19 @@ class DevRAIApplication:
 
             await self.queue_manager.start(num_workers=3)
 
-            # --- Load commands inside the async startup function ---
-            try:
-                await self.discord_bot.load_extension("integrations.discord.cogs")
-            except (ImportError, commands.ExtensionError) as e:
-                logger.error("Failed to load Discord cog extension: %s", e)
-
-            # Start the bot as a background task.
-            asyncio.create_task(
-                self.discord_bot.start(settings.discord_bot_token)
-            )
+            if settings.enable_discord_bot:
+                # --- Load commands inside the async startup function ---
+                try:
+                    await self.discord_bot.load_extension("integrations.discord.cogs")
+                except (ImportError, commands.ExtensionError) as e:
+                    logger.error("Failed to load Discord cog extension: %s", e)
+
+                # Start the bot as a background task.
+                asyncio.create_task(
+                    self.discord_bot.start(settings.discord_bot_token)
+                )
+            else:
+                logger.info("Discord bot disabled (ENABLE_DISCORD_BOT=false); serving API only")
             logger.info("Background tasks started successfully!")
         except Exception as e:
             logger.error(f"Error during background task startup: {e}", exc_info=True)
@@ -85,6 +104,19 @@ class DevRAIApplication:
             logger.info("Queue manager has been stopped.")
         except Exception as e:
             logger.error(f"Error stopping queue manager: {e}", exc_info=True)
+        try:
+            await close_http_session()
+        except Exception as e:
+            logger.error(f"Error closing code-graph HTTP session: {e}", exc_info=True)
+        try:
+            await close_weaviate_client()
+            logger.info("Weaviate client has been closed.")
+        except Exception as e:
+            logger.error(f"Error closing Weaviate client: {e}", exc_info=True)
+        try:
+            close_embedding_caches()
+        except Exception as e:
+            logger.error(f"Error closing embedding cache: {e}", exc_info=True)
         logger.info("All background tasks and connections stopped.")
 
 
@@ -102,7 +134,7 @@ async def lifespan(app: FastAPI):
     await app_instance.stop_background_tasks()
 
 
-api = FastAPI(title="Devr.AI API", version="1.0", lifespan=lifespan)
+api = FastAPI(title="Devr.AI API", version="1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configure CORS
 api.add_middleware(
@@ -118,10 +150,14 @@ api.add_middleware(
     allow_headers=["*"],
 )
 
-@api.get("/favicon.ico")
+# Compress larger JSON bodies (integration lists, health details); small responses skip the overhead
+api.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@api.get("/favicon.ico", include_in_schema=False)
 async def favicon():
     """Return empty favicon to prevent 404 logs"""
-    return Response(status_code=204)
+    # Browsers cache the empty icon for a day instead of asking on every page load
+    return Response(status_code=204, headers={"Cache-Control": "public, max-age=86400"})
 
 api.include_router(api_router)
 
@@ -131,17 +167,24 @@ if __name__ == "__main__":
         "DISCORD_BOT_TOKEN", "SUPABASE_URL", "SUPABASE_KEY",
         "BACKEND_URL", "GEMINI_API_KEY", "TAVILY_API_KEY", "GITHUB_TOKEN"
     ]
+    if not settings.enable_discord_bot:
+        required_vars.remove("DISCORD_BOT_TOKEN")
     missing_vars = [var for var in required_vars if not getattr(settings, var.lower(), None)]
 
     if missing_vars:
         logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
         sys.exit(1)
 
+    # Single worker on purpose: each worker's lifespan would start its own Discord gateway
+    # connection and queue consumers, duplicating every bot reply
     uvicorn.run(
         "__main__:api",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=settings.environment == "development",
+        # Per-request access lines only in development; uvicorn's loggers propagate to our queued root handler
+        access_log=settings.environment == "development",
+        log_config=None,
         ws_ping_interval=20,
         ws_ping_timeout=20
     )
@@ -3,9 +3,6 @@ Script to start the GitHub MCP server
 """
 
 import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from app.classification.classification_router import ClassificationRouter
+
+
+def fake_llm(content: str):
+    llm = MagicMock()
+    llm.ainvoke = AsyncMock(return_value=MagicMock(content=content))
+    return llm
+
+
+class TestIsTrivialMessage(unittest.TestCase):
+    def test_trivial_messages(self):
+        for message in ["ok", "thanks!", "  lol  ", "", "   ", "+1", "👍", "nice one"]:
+            with self.subTest(message=message):
+                self.assertTrue(ClassificationRouter.is_trivial_message(message))
+
+    def test_non_trivial_messages(self):
+        for message in [
+            "why?",
+            "?",
+            "how do I set up the backend locally",
+            "The bot crashes on startup",
+            "  thank you so much  ",
+        ]:
+            with self.subTest(message=message):
+                self.assertFalse(ClassificationRouter.is_trivial_message(message))
+
+
+class TestVerdictCache(unittest.IsolatedAsyncioTestCase):
+    async def test_repeated_message_reuses_verdict(self):
+        llm = fake_llm('{"needs_devrel": false, "priority": "low", "reasoning": "chatter"}')
+        router = ClassificationRouter(llm_client=llm)
+
+        first = await router.should_process_message("How do I run the tests?")
+        second = await router.should_process_message("  how do I   RUN the tests?")
+
+        self.assertEqual(llm.ainvoke.await_count, 1)
+        self.assertFalse(second["needs_devrel"])
+        self.assertEqual(second["priority"], "low")
+        self.assertEqual(first["original_message"], "How do I run the tests?")
+        self.assertEqual(second["original_message"], "  how do I   RUN the tests?")
+
+    async def test_different_messages_are_classified_separately(self):
+        llm = fake_llm('{"needs_devrel": true, "priority": "high", "reasoning": "question"}')
+        router = ClassificationRouter(llm_client=llm)
+        await router.should_process_message("How do I run the tests?")
+        await router.should_process_message("How do I deploy the bot?")
+        self.assertEqual(llm.ainvoke.await_count, 2)
+
+    async def test_fallback_verdict_is_not_cached(self):
+        llm = fake_llm("not json")
+        router = ClassificationRouter(llm_client=llm)
+        await router.should_process_message("How do I run the tests?")
+        result = await router.should_process_message("How do I run the tests?")
+        self.assertEqual(llm.ainvoke.await_count, 2)
+        self.assertTrue(result["needs_devrel"])
+
+    async def test_cache_is_bounded(self):
+        llm = fake_llm('{"needs_devrel": true, "priority": "medium", "reasoning": "question"}')
+        router = ClassificationRouter(llm_client=llm, cache_size=2)
+        for message in ["first question?", "second question?", "third question?"]:
+            await router.should_process_message(message)
+        self.assertEqual(len(router._verdicts), 2)
+        await router.should_process_message("first question?")
+        self.assertEqual(llm.ainvoke.await_count, 4)
+
+    async def test_expired_verdict_is_refreshed(self):
+        llm = fake_llm('{"needs_devrel": true, "priority": "medium", "reasoning": "question"}')
+        router = ClassificationRouter(llm_client=llm, cache_ttl=0.0)
+        await router.should_process_message("How do I run the tests?")
+        await router.should_process_message("How do I run the tests?")
+        self.assertEqual(llm.ainvoke.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from app.agents.devrel.github.tools.contributor_recommendation import _normalize_keywords
+
+
+class TestNormalizeKeywords(unittest.TestCase):
+    def test_case_folding_and_stripping(self):
+        self.assertEqual(_normalize_keywords(["  React ", "TypeScript"]), ["react", "typescript"])
+
+    def test_dedupe_keeps_first_occurrence_order(self):
+        keywords = ["Python", "fastapi", "python", "FastAPI", "docker"]
+        self.assertEqual(_normalize_keywords(keywords), ["python", "fastapi", "docker"])
+
+    def test_stopwords_and_blanks_are_dropped(self):
+        self.assertEqual(_normalize_keywords(["and", "The", "", "   ", "redis"]), ["redis"])
+
+    def test_non_string_keywords_are_stringified(self):
+        self.assertEqual(_normalize_keywords(["OAuth", 2]), ["oauth", "2"])
+
+    def test_empty_input(self):
+        for keywords in ([], None, ()):
+            with self.subTest(keywords=keywords):
+                self.assertEqual(_normalize_keywords(keywords), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from unittest.mock import patch
+from app.agents.devrel.tools.search_tool.ddg import DuckDuckGoSearchTool
+
+MONOTONIC = "app.agents.devrel.tools.search_tool.ddg.time.monotonic"
+
+
+class TestDuckDuckGoCache(unittest.TestCase):
+    def setUp(self):
+        self.tool = DuckDuckGoSearchTool(cache_size=2, cache_ttl=60.0)
+        self.results = [{"title": "t", "content": "c", "url": "https://x", "score": 0}]
+
+    def test_hit_within_ttl(self):
+        with patch(MONOTONIC, return_value=100.0):
+            self.tool._cache_set(("query", 5), self.results)
+        with patch(MONOTONIC, return_value=160.0):
+            self.assertEqual(self.tool._cache_get(("query", 5)), self.results)
+
+    def test_expired_entry_is_removed(self):
+        with patch(MONOTONIC, return_value=100.0):
+            self.tool._cache_set(("query", 5), self.results)
+        with patch(MONOTONIC, return_value=160.5):
+            self.assertIsNone(self.tool._cache_get(("query", 5)))
+        self.assertNotIn(("query", 5), self.tool._cache)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        self.tool._cache_set(("first", 5), self.results)
+        self.tool._cache_set(("second", 5), self.results)
+        self.tool._cache_get(("first", 5))
+        self.tool._cache_set(("third", 5), self.results)
+
+        self.assertEqual(list(self.tool._cache), [("first", 5), ("third", 5)])
+        self.assertIsNone(self.tool._cache_get(("second", 5)))
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(self.tool._cache_get(("never stored", 5)))
+
+
+class TestDuckDuckGoSearch(unittest.IsolatedAsyncioTestCase):
+    async def test_repeated_query_skips_the_network(self):
+        tool = DuckDuckGoSearchTool()
+        response = [{"title": "Docs", "body": "Setup guide", "href": "https://docs"}]
+        with patch.object(tool, "_perform_search", return_value=response) as perform:
+            first = await tool.search("How to  Contribute")
+            second = await tool.search("how to contribute")
+        self.assertEqual(perform.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]["url"], "https://docs")
+
+    async def test_empty_results_are_not_cached(self):
+        tool = DuckDuckGoSearchTool()
+        with patch.object(tool, "_perform_search", return_value=[]) as perform:
+            await tool.search("nothing")
+            await tool.search("nothing")
+        self.assertEqual(perform.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
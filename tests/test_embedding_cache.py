@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import sqlite3
+import tempfile
+import unittest
+import numpy as np
+from backend.app.services.embedding_service import embedding_cache
+from backend.app.services.embedding_service.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = EmbeddingCache(":memory:")
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_get_miss_returns_none(self):
+        self.assertIsNone(self.cache.get("model", "never stored"))
+
+    def test_set_then_get_round_trips_float32(self):
+        self.cache.set("model", "hello", np.array([0.5, -1.0, 2.0], dtype=np.float64))
+        vector = self.cache.get("model", "hello")
+        self.assertEqual(vector.dtype, np.float32)
+        np.testing.assert_array_equal(vector, [0.5, -1.0, 2.0])
+
+    def test_entries_are_scoped_by_model(self):
+        self.cache.set("model-a", "hello", np.ones(3))
+        self.assertIsNone(self.cache.get("model-b", "hello"))
+
+    def test_set_many_and_get_many_return_only_hits(self):
+        texts = [f"text {i}" for i in range(600)]
+        self.cache.set_many("model", texts, np.arange(600 * 2, dtype=np.float32).reshape(600, 2))
+        found = self.cache.get_many("model", texts + ["missing"])
+        self.assertEqual(len(found), 600)
+        self.assertNotIn("missing", found)
+        np.testing.assert_array_equal(found["text 599"], [1198.0, 1199.0])
+
+    def test_close_makes_cache_unusable(self):
+        cache = EmbeddingCache(":memory:")
+        cache.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cache.get("model", "hello")
+
+    def test_context_manager_closes_on_exit(self):
+        with EmbeddingCache(":memory:") as cache:
+            cache.set("model", "hello", np.ones(2))
+            self.assertIsNotNone(cache.get("model", "hello"))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cache.get("model", "hello")
+
+
+class TestSharedEmbeddingCaches(unittest.TestCase):
+    def tearDown(self):
+        embedding_cache.close_embedding_caches()
+
+    def test_empty_path_disables_caching(self):
+        self.assertIsNone(embedding_cache.get_embedding_cache(""))
+
+    def test_one_cache_per_path_until_closed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            first = embedding_cache.get_embedding_cache(path)
+            self.assertIs(first, embedding_cache.get_embedding_cache(path))
+
+            embedding_cache.close_embedding_caches()
+            with self.assertRaises(sqlite3.ProgrammingError):
+                first.get("model", "hello")
+            reopened = embedding_cache.get_embedding_cache(path)
+            self.assertIsNot(reopened, first)
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
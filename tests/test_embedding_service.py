@@ -2,13 +2,24 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from backend.app.services.embedding_service.service import EmbeddingService
+from backend.app.services.embedding_service.embedding_cache import EmbeddingCache
 import unittest
 from sklearn.metrics.pairwise import cosine_similarity
 
 
 class TestEmbeddingService(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One in-memory embedding cache for the whole class: no dev cache file, no disk I/O
+        cls.cache = EmbeddingCache(":memory:")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cache.close()
+
     async def asyncSetUp(self):
         self.embedding_service = EmbeddingService(device="cuda")
+        self.embedding_service._cache = self.cache
 
     async def test_get_embedding(self):
         text = "Hi, this seems to be great!"
@@ -20,6 +31,14 @@ class TestEmbeddingService(unittest.IsolatedAsyncioTestCase):
         embeddings = await self.embedding_service.get_embeddings(texts)
         similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
         self.assertTrue(similarity > 0.5)
+
+    async def test_similarity_matrix(self):
+        texts = ["Hi, this seems to be great!", "This is good!", "The build failed on CI."]
+        matrix = await self.embedding_service.similarity_matrix(texts)
+        self.assertEqual(matrix.shape, (3, 3))
+        for i in range(3):
+            self.assertAlmostEqual(float(matrix[i][i]), 1.0, places=4)
+        self.assertTrue(matrix[0][1] > matrix[0][2])
         
     def test_get_model_info(self):
         # Access model once to initialize it
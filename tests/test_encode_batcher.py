@@ -0,0 +1,100 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+import numpy as np
+from app.services.embedding_service import service as embedding_service
+from app.services.embedding_service.service import EmbeddingService, _EncodeBatcher
+
+
+class FakeModel:
+    """Stands in for SentenceTransformer: records each encode call, optionally blocking until released"""
+
+    def __init__(self, block: bool = False, error: Exception = None):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.error = error
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+class TestEncodeBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_lone_caller_is_encoded_alone(self):
+        model = FakeModel()
+        batcher = _EncodeBatcher(model)
+        vector = await batcher.encode("abc")
+        np.testing.assert_array_equal(vector, [3.0, 1.0])
+        self.assertEqual(model.calls, [["abc"]])
+
+    async def test_same_turn_callers_share_one_pass(self):
+        model = FakeModel()
+        batcher = _EncodeBatcher(model)
+        vectors = await asyncio.gather(*(batcher.encode(text) for text in ["a", "bb", "a", "ccc"]))
+        self.assertEqual(model.calls, [["a", "bb", "ccc"]])
+        self.assertEqual([v[0] for v in vectors], [1.0, 2.0, 1.0, 3.0])
+
+    async def test_callers_during_a_running_batch_go_out_together(self):
+        model = FakeModel(block=True)
+        batcher = _EncodeBatcher(model)
+        first = asyncio.create_task(batcher.encode("first"))
+        await asyncio.to_thread(model.started.wait, 5)
+        queued = [asyncio.create_task(batcher.encode(text)) for text in ["x", "yy", "zzz"]]
+        await asyncio.sleep(0)
+        self.assertEqual(len(model.calls), 1)
+        self.assertEqual(len(batcher._tasks), 1)
+
+        model.release.set()
+        await asyncio.gather(first, *queued)
+        self.assertEqual(model.calls, [["first"], ["x", "yy", "zzz"]])
+        await asyncio.sleep(0)
+        self.assertEqual(batcher._tasks, set())
+
+    async def test_full_batch_flushes_without_waiting(self):
+        model = FakeModel()
+        batcher = _EncodeBatcher(model, max_batch=2)
+        await asyncio.gather(*(batcher.encode(text) for text in ["a", "b", "c"]))
+        self.assertEqual(model.calls[0], ["a", "b"])
+        self.assertEqual(sorted(text for call in model.calls for text in call), ["a", "b", "c"])
+
+    async def test_encode_error_reaches_every_caller(self):
+        model = FakeModel(error=RuntimeError("boom"))
+        batcher = _EncodeBatcher(model)
+        results = await asyncio.gather(batcher.encode("a"), batcher.encode("b"), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        # The batcher is usable again after a failed batch
+        model.error = None
+        np.testing.assert_array_equal(await batcher.encode("ok"), [2.0, 1.0])
+
+
+class TestServiceBatchers(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        embedding_service._batchers.clear()
+        embedding_service._recent_embeddings.clear()
+        patcher = patch.object(embedding_service, "_load_sentence_transformer", side_effect=lambda *args: FakeModel())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache_patcher = patch.object(embedding_service, "EMBEDDING_CACHE_PATH", "")
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    async def test_batchers_are_keyed_by_model_device_and_backend(self):
+        await EmbeddingService(model_name="m", device="cpu").get_embedding("cpu text")
+        await EmbeddingService(model_name="m", device="cuda").get_embedding("cuda text")
+        await EmbeddingService(model_name="m", device="cpu").get_embedding("more cpu text")
+        self.assertEqual(set(embedding_service._batchers), {("m", "cpu", "torch"), ("m", "cuda", "torch")})
+
+
+if __name__ == "__main__":
+    unittest.main()
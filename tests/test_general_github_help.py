@@ -0,0 +1,28 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from app.agents.devrel.github.tools.general_github_help import _dedupe_results
+
+
+class TestDedupeResults(unittest.TestCase):
+    def test_duplicate_content_is_dropped(self):
+        results = [
+            {"title": "A", "url": "https://a", "content": "same text"},
+            {"title": "B", "url": "https://b", "content": "  same text \n"},
+            {"title": "C", "url": "https://c", "content": "other text"},
+        ]
+        self.assertEqual([r["title"] for r in _dedupe_results(results)], ["A", "C"])
+
+    def test_results_without_content_are_kept(self):
+        results = [
+            {"title": "A", "url": "https://a", "content": ""},
+            {"title": "B", "url": "https://b"},
+            {"title": "C", "url": "https://c", "content": None},
+            {"title": "D", "url": "https://d", "content": "   "},
+        ]
+        self.assertEqual([r["title"] for r in _dedupe_results(results)], ["A", "B", "C", "D"])
+
+
+if __name__ == "__main__":
+    unittest.main()
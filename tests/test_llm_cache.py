@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from app.core import llm as llm_module
+from app.core.llm import ainvoke_cached
+from app.agents.devrel.github.tools.contributor_recommendation import _is_json_object
+
+
+def fake_llm(*contents: str):
+    llm = MagicMock()
+    llm.model = "test-model"
+    llm.temperature = 0.1
+    llm.ainvoke = AsyncMock(side_effect=[MagicMock(content=content) for content in contents])
+    return llm
+
+
+class TestAinvokeCached(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        llm_module._response_cache.clear()
+
+    async def test_identical_prompt_is_served_from_cache(self):
+        llm = fake_llm("summary")
+        self.assertEqual(await ainvoke_cached(llm, "prompt"), "summary")
+        self.assertEqual(await ainvoke_cached(llm, "prompt"), "summary")
+        self.assertEqual(llm.ainvoke.await_count, 1)
+
+    async def test_response_rejected_by_predicate_is_not_cached(self):
+        llm = fake_llm("Sure! Here is the JSON:", '{"aligned_query": "react"}')
+        first = await ainvoke_cached(llm, "prompt", should_cache=_is_json_object)
+        second = await ainvoke_cached(llm, "prompt", should_cache=_is_json_object)
+        third = await ainvoke_cached(llm, "prompt", should_cache=_is_json_object)
+
+        self.assertEqual(first, "Sure! Here is the JSON:")
+        self.assertEqual(second, '{"aligned_query": "react"}')
+        self.assertEqual(third, second)
+        self.assertEqual(llm.ainvoke.await_count, 2)
+
+    async def test_empty_response_is_not_cached(self):
+        llm = fake_llm("  ", "summary")
+        self.assertEqual(await ainvoke_cached(llm, "prompt"), "")
+        self.assertEqual(await ainvoke_cached(llm, "prompt"), "summary")
+        self.assertEqual(llm.ainvoke.await_count, 2)
+
+
+class TestIsJsonObject(unittest.TestCase):
+    def test_only_json_objects_pass(self):
+        self.assertTrue(_is_json_object('{"keywords": []}'))
+        self.assertFalse(_is_json_object('["react"]'))
+        self.assertFalse(_is_json_object("```json\n{}\n```"))
+        self.assertFalse(_is_json_object(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import asyncio
+import unittest
+import orjson
+from app.core.orchestration.queue_manager import AsyncQueueManager, QueuePriority
+
+
+class FakeMessage:
+    """Minimal stand-in for an aio_pika incoming message"""
+
+    def __init__(self, message_id: str, message_type: str = "task"):
+        self.body = orjson.dumps({
+            "id": message_id,
+            "priority": "n/a",
+            "data": {"type": message_type, "id": message_id},
+        })
+        self.acked = False
+        self.nacked = False
+
+    async def ack(self):
+        self.acked = True
+
+    async def nack(self, requeue: bool = True):
+        self.nacked = True
+
+
+class TestQueuePriority(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.manager = AsyncQueueManager()
+        self.handled = []
+        self.first_started = asyncio.Event()
+        self.release_first = asyncio.Event()
+
+        async def handler(data):
+            self.handled.append(data["id"])
+            if len(self.handled) == 1:
+                self.first_started.set()
+                await self.release_first.wait()
+
+        self.manager.register_handler("task", handler)
+
+    async def asyncTearDown(self):
+        for task in self.manager.worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self.manager.worker_tasks, return_exceptions=True)
+
+    def deliver(self, priority: QueuePriority, message: FakeMessage):
+        return self.manager._make_consumer(priority)(message)
+
+    def start_workers(self, count: int):
+        for i in range(count):
+            self.manager.worker_tasks.append(asyncio.create_task(self.manager._worker(f"worker-{i}")))
+
+    async def test_high_is_handled_before_buffered_low(self):
+        self.start_workers(1)
+        await self.deliver(QueuePriority.LOW, FakeMessage("low-1"))
+        await asyncio.wait_for(self.first_started.wait(), 1)
+
+        # The only worker is busy; these arrive and wait, LOW first
+        messages = [FakeMessage("low-2"), FakeMessage("low-3"), FakeMessage("medium-1"), FakeMessage("high-1")]
+        await self.deliver(QueuePriority.LOW, messages[0])
+        await self.deliver(QueuePriority.LOW, messages[1])
+        await self.deliver(QueuePriority.MEDIUM, messages[2])
+        await self.deliver(QueuePriority.HIGH, messages[3])
+
+        self.release_first.set()
+        for _ in range(50):
+            if len(self.handled) == 5:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.handled, ["low-1", "high-1", "medium-1", "low-2", "low-3"])
+        self.assertTrue(all(message.acked for message in messages))
+
+    async def test_same_priority_keeps_arrival_order(self):
+        self.release_first.set()
+        for name in ["a", "b", "c"]:
+            await self.deliver(QueuePriority.MEDIUM, FakeMessage(name))
+        self.start_workers(2)
+        for _ in range(50):
+            if len(self.handled) == 3:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.handled, ["a", "b", "c"])
+
+    async def test_unparseable_message_is_rejected(self):
+        self.start_workers(1)
+        bad = FakeMessage("bad")
+        bad.body = b"not json"
+        await self.deliver(QueuePriority.HIGH, bad)
+        for _ in range(50):
+            if bad.nacked:
+                break
+            await asyncio.sleep(0.01)
+        self.assertTrue(bad.nacked)
+        self.assertFalse(bad.acked)
+
+
+if __name__ == "__main__":
+    unittest.main()
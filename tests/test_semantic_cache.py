@@ -0,0 +1,60 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import unittest
+from unittest.mock import patch
+import numpy as np
+from backend.app.services.embedding_service.semantic_cache import SemanticCache
+
+MONOTONIC = "backend.app.services.embedding_service.semantic_cache.time.monotonic"
+
+
+class TestSemanticCache(unittest.TestCase):
+    def setUp(self):
+        # Few planes so near vectors reliably share a bucket
+        self.cache = SemanticCache(num_planes=2, maxsize=2, threshold=0.95)
+        self.query = np.array([1.0, 0.2, 0.0, 0.0])
+
+    def bucket(self, embedding):
+        return self.cache._bucket(self.cache._normalize(embedding))
+
+    def test_hit_above_threshold(self):
+        self.cache.set(self.query, "answer")
+        near = self.query + np.array([0.0, 0.01, 0.01, 0.0])
+        self.assertEqual(self.bucket(near), self.bucket(self.query))
+        self.assertEqual(self.cache.get(near), "answer")
+
+    def test_miss_below_threshold(self):
+        self.cache.set(self.query, "answer")
+        far = np.array([1.0, 0.6, 0.0, 0.0])
+        self.assertEqual(self.bucket(far), self.bucket(self.query))
+        self.assertLess(float(np.dot(self.cache._normalize(far), self.cache._normalize(self.query))), 0.95)
+        self.assertIsNone(self.cache.get(far))
+
+    def test_extra_key_scopes_entries(self):
+        self.cache.set(self.query, "answer", extra_key="user-1")
+        self.assertIsNone(self.cache.get(self.query, extra_key="user-2"))
+        self.assertEqual(self.cache.get(self.query, extra_key="user-1"), "answer")
+
+    def test_maxsize_evicts_least_recently_used(self):
+        self.cache.set(self.query, "first", extra_key="a")
+        self.cache.set(self.query, "second", extra_key="b")
+        # Touch "a" so "b" becomes the oldest entry
+        self.assertEqual(self.cache.get(self.query, extra_key="a"), "first")
+        self.cache.set(self.query, "third", extra_key="c")
+
+        self.assertEqual(len(self.cache._entries), 2)
+        self.assertIsNone(self.cache.get(self.query, extra_key="b"))
+        self.assertEqual(self.cache.get(self.query, extra_key="a"), "first")
+        self.assertEqual(self.cache.get(self.query, extra_key="c"), "third")
+
+    def test_expired_entry_is_a_miss(self):
+        with patch(MONOTONIC, return_value=1000.0):
+            self.cache.set(self.query, "answer")
+        with patch(MONOTONIC, return_value=1000.0 + self.cache.ttl_seconds + 1):
+            self.assertIsNone(self.cache.get(self.query))
+        self.assertEqual(len(self.cache._entries), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
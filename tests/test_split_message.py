@@ -0,0 +1,58 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import unittest
+from integrations.discord.bot import DISCORD_MESSAGE_LIMIT, split_message
+
+
+class TestSplitMessage(unittest.TestCase):
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(list(split_message("hello there")), ["hello there"])
+
+    def test_chunks_never_exceed_limit(self):
+        text = "word " * 1000
+        chunks = list(split_message(text))
+        self.assertTrue(all(0 < len(chunk) <= DISCORD_MESSAGE_LIMIT for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text.strip())
+
+    def test_unbroken_text_is_cut_at_limit(self):
+        self.assertEqual(list(split_message("abcdefghij", 4)), ["abcd", "efgh", "ij"])
+
+    def test_prefers_last_newline(self):
+        self.assertEqual(list(split_message("ab cd\nef gh", 8)), ["ab cd", "ef gh"])
+
+    def test_newline_right_after_limit_is_used(self):
+        self.assertEqual(list(split_message("abcd\nefgh", 4)), ["abcd", "efgh"])
+
+    def test_falls_back_to_whitespace(self):
+        self.assertEqual(list(split_message("ab cd ef", 5)), ["ab cd", "ef"])
+
+    def test_newline_runs_do_not_yield_blank_chunks(self):
+        self.assertEqual(list(split_message("aaaaa\n\n\n\nbbb", 4)), ["aaaa", "a", "bbb"])
+
+    def test_leading_whitespace_is_dropped(self):
+        self.assertEqual(list(split_message("    x", 2)), ["x"])
+
+    def test_indented_code_keeps_its_indentation(self):
+        code = "def handler():\n    if ready:\n        return 1\n    return 0"
+        chunks = list(split_message(code, 28))
+        self.assertEqual(chunks, ["def handler():\n    if ready:", "        return 1", "    return 0"])
+        self.assertEqual("\n".join(chunks), code)
+
+    def test_nested_list_keeps_its_indentation(self):
+        text = "- item\n  - child one\n  - child two"
+        self.assertEqual(list(split_message(text, 20)), ["- item\n  - child one", "  - child two"])
+
+    def test_only_the_separator_is_dropped(self):
+        self.assertEqual(list(split_message("abc\n  def", 5)), ["abc", "  def"])
+
+    def test_leading_indentation_is_not_a_break_point(self):
+        self.assertEqual(list(split_message("x\n  abcdef", 4)), ["x", "  ab", "cdef"])
+
+    def test_whitespace_only_text_yields_nothing(self):
+        self.assertEqual(list(split_message("  \n\t ", 5)), [])
+        self.assertEqual(list(split_message("")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+import time
+import unittest
+from unittest.mock import patch
+from app.services.github.token_pool import GITHUB_RATE_LIMIT, GitHubTokenPool
+
+
+class TestGitHubTokenPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = GitHubTokenPool(["token-a", "token-b", "token-c"])
+
+    def test_requires_a_token(self):
+        with self.assertRaises(ValueError):
+            GitHubTokenPool([])
+
+    def test_acquire_picks_most_remaining(self):
+        self.pool.update("token-a", {"X-RateLimit-Remaining": "10"})
+        self.pool.update("token-b", {"X-RateLimit-Remaining": "4000"})
+        self.pool.update("token-c", {"X-RateLimit-Remaining": "300"})
+        self.assertEqual(self.pool.acquire(), "token-b")
+
+    def test_below_threshold_falls_back_to_soonest_reset(self):
+        now = time.time()
+        self.pool.update("token-a", {"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": str(now + 900)})
+        self.pool.update("token-b", {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(now + 60)})
+        self.pool.mark_exhausted("token-c", reset=str(now + 300))
+        self.assertEqual(self.pool.acquire(), "token-b")
+
+        # One healthy token is enough to be preferred over any reset time
+        self.pool.update("token-c", {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": str(now + 3000)})
+        self.assertEqual(self.pool.acquire(), "token-c")
+
+    def test_update_from_headers(self):
+        reset = time.time() + 600
+        self.pool.update("token-a", {"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": str(reset)})
+        self.assertEqual(self.pool._remaining["token-a"], 7)
+        self.assertEqual(self.pool._reset_at["token-a"], reset)
+
+    def test_update_without_remaining_header_is_ignored(self):
+        self.pool.update("token-a", {"X-RateLimit-Reset": "123"})
+        self.assertEqual(self.pool._remaining["token-a"], GITHUB_RATE_LIMIT)
+        self.assertEqual(self.pool._reset_at["token-a"], 0.0)
+
+    def test_recovers_after_reset_time(self):
+        now = time.time()
+        for token in self.pool.tokens:
+            self.pool.mark_exhausted(token, reset=str(now + 60))
+        self.pool.update("token-c", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(now + 30)})
+
+        with patch("app.services.github.token_pool.time.time", return_value=now + 45):
+            self.assertEqual(self.pool.acquire(), "token-c")
+        self.assertEqual(self.pool._remaining["token-c"], GITHUB_RATE_LIMIT)
+        self.assertEqual(self.pool._reset_at["token-c"], 0.0)
+        self.assertEqual(self.pool._remaining["token-a"], 0)
+
+    def test_all_tokens_exhausted(self):
+        now = time.time()
+        self.pool.mark_exhausted("token-a", reset=str(now + 120))
+        self.pool.mark_exhausted("token-b", reset=str(now + 30))
+        self.assertEqual(self.pool.seconds_until_available(), 0.0)
+
+        self.pool.mark_exhausted("token-c", reset=str(now + 90))
+        with patch("app.services.github.token_pool.time.time", return_value=now):
+            self.assertAlmostEqual(self.pool.seconds_until_available(), 30.0)
+        with patch("app.services.github.token_pool.time.time", return_value=now + 200):
+            self.assertEqual(self.pool.seconds_until_available(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()